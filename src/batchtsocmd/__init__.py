@@ -2,7 +2,8 @@
 batchtsocmd - Execute TSO and Db2 commands via IKJEFT1B with encoding conversion
 """
 
-__version__ = "0.2.1"
+from ._version import __version__
+
 __author__ = "Mike Fulton"
 
 from .main import tsocmd, db2sql, db2op, db2bind, db2run, main, version
@@ -0,0 +1,259 @@
+"""
+_cliutil.py - Helpers shared by the batchtsocmd command-line interfaces
+"""
+
+import io
+import os
+import stat
+import sys
+from typing import TYPE_CHECKING, Any, Iterable
+from ._version import __version__
+
+if TYPE_CHECKING:
+    import argparse
+
+# Size of each read when copying SYSIN from stdin
+STDIN_CHUNK_SIZE = 65536
+
+# Number of leading bytes checked to decide whether input has any content
+HEAD_SIZE = 64
+
+# An argument as (flags, add_argument() keywords)
+ArgSpec = tuple[tuple[str, ...], dict[str, Any]]
+
+# Arguments shared by several CLIs
+SYSTEM_ARG: ArgSpec = (('--system',), {'help': 'Db2 subsystem ID (or set DB2_SYSTEM env var)'})
+STEPLIB_ARG: ArgSpec = (('--steplib',), {'help': 'Optional STEPLIB dataset name(s). Use colon to concatenate (or set DB2_STEPLIB env var)'})
+SYSTSPRT_ARG: ArgSpec = (('--systsprt',), {'default': 'stdout', 'help': "Path to SYSTSPRT output file or 'stdout' (default: stdout)"})
+SYSPRINT_ARG: ArgSpec = (('--sysprint',), {'default': 'stdout', 'help': "Path to SYSPRINT output file or 'stdout' (default: stdout)"})
+DEBUG_ARG: ArgSpec = (('--debug',), {'action': 'store_true', 'help': 'Preserve temporary files for debugging (do not delete SYSTSIN, SYSIN, SYSTSPRT, SYSPRINT)'})
+VERBOSE_ARG: ArgSpec = (('-v', '--verbose'), {'action': 'store_true', 'help': 'Enable verbose output'})
+VERSION_ARG: ArgSpec = (('--version',), {'action': 'version', 'version': f'%(prog)s {__version__}'})
+
+
+# Environment variables the CLIs take defaults from
+DB2_ENV_VARS = ('DB2_SYSTEM', 'DB2_PLAN', 'DB2_TOOLLIB', 'DB2_STEPLIB', 'DB2_DBRMLIB', 'DB2_LIBRARY')
+
+
+def usage_error(message: str) -> int:
+    """
+    Report a command-line usage error on stderr with a single write.
+
+    Args:
+        message: Error text, without the 'ERROR: ' prefix
+
+    Returns:
+        1, the return code for usage errors
+    """
+    sys.stderr.write(f"ERROR: {message}\n\nUse --help for usage information\n")
+    return 1
+
+
+def db2_env() -> dict[str, str | None]:
+    """
+    Snapshot the Db2 environment variables in one pass.
+
+    The snapshot is taken per call rather than cached, so a process that runs
+    several commands through main() sees environment changes between them.
+
+    Returns:
+        Dict mapping each name in DB2_ENV_VARS to its value, or None if unset
+    """
+    environ = os.environ
+    return {name: environ.get(name) for name in DB2_ENV_VARS}
+
+
+def add_arguments(parser: 'argparse.ArgumentParser', specs: Iterable[ArgSpec]) -> None:
+    """
+    Add each argument in a table of argument specs to parser.
+
+    Args:
+        parser: Parser (or subparser) to add the arguments to
+        specs: (flags, add_argument() keywords) pairs, in help order
+    """
+    for flags, kwargs in specs:
+        parser.add_argument(*flags, **kwargs)
+
+
+def stdin_file() -> str | None:
+    """
+    Return a path that reads stdin in place when it is redirected from a regular file.
+
+    When stdin is a regular file (e.g. 'db2cmd < query.sql') it can be reopened
+    through /dev/fd, so there is no need to copy it to a temporary file first.
+    The reopened file is read from its start, so this is only done while
+    stdin is still at offset 0; if part of it has already been read (e.g.
+    '{ read hdr; db2cmd; } < query.sql') the rest is left to spool_stdin().
+
+    Returns:
+        '/dev/fd/<n>' path for stdin, or None if stdin is a pipe, terminal or
+        socket, is not at its start, starts with blank content, or the
+        platform has no /dev/fd
+    """
+    try:
+        fd = sys.stdin.fileno()
+        st = os.fstat(fd)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+        return None
+
+    # Data already read from stdin must not be submitted again
+    try:
+        if os.lseek(fd, 0, os.SEEK_CUR) != 0:
+            return None
+    except OSError:
+        return None
+
+    # A blank head is left to spool_stdin() to check in full
+    if not os.pread(fd, HEAD_SIZE, 0).strip():
+        return None
+
+    path = f"/dev/fd/{fd}"
+    if not os.path.exists(path):
+        return None
+
+    return path
+
+
+def spool_stdin(suffix: str = '.sysin') -> str | None:
+    """
+    Copy stdin to a temporary file in fixed-size chunks.
+
+    The data is copied as raw bytes, so it is never held in memory as a whole
+    and is not decoded; tsocmd() pads and converts the file afterwards.
+
+    Where the platform supports O_TMPFILE (Linux) the file is an anonymous
+    inode reached through /proc/self/fd, so no name is generated and nothing
+    is left on disk; elsewhere (e.g. z/OS UNIX) it falls back to mkstemp().
+
+    Args:
+        suffix: Suffix for the temporary file name (mkstemp fallback only)
+
+    Returns:
+        Path to the temporary file (caller must pass it to release_spool()),
+        or None if stdin was empty or contained only whitespace
+    """
+    fd, path = _open_spool(suffix)
+    keep = False
+
+    # The file object closes a named file's descriptor; an anonymous file's
+    # descriptor stays open to be returned. Either way, the finally clause is
+    # the only place a spool file that is not returned is dropped.
+    try:
+        with os.fdopen(fd, 'wb', closefd=path is not None) as outfile:
+            stdin = sys.stdin.buffer
+            has_content = _head_has_content(stdin)
+            while True:
+                chunk = stdin.read1(STDIN_CHUNK_SIZE)
+                if not chunk:
+                    break
+                outfile.write(chunk)
+                if not has_content and chunk.strip():
+                    has_content = True
+        keep = has_content
+    finally:
+        if not keep:
+            _discard_spool(fd, path)
+
+    if not keep:
+        return None
+
+    if path is None:
+        return f"/proc/self/fd/{fd}"
+    return path
+
+
+def release_spool(path: str) -> None:
+    """
+    Remove a temporary file returned by spool_stdin().
+
+    Args:
+        path: Path returned by spool_stdin()
+    """
+    if path.startswith('/proc/self/fd/'):
+        os.close(int(path[len('/proc/self/fd/'):]))
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _open_spool(suffix: str) -> tuple[int, str | None]:
+    """Open an anonymous O_TMPFILE file if possible, else a named mkstemp() file"""
+    # Imported here so that --help and --version do not pay for it
+    import tempfile
+
+    o_tmpfile = getattr(os, 'O_TMPFILE', None)
+    if o_tmpfile is not None and os.path.isdir('/proc/self/fd'):
+        try:
+            return os.open(tempfile.gettempdir(), o_tmpfile | os.O_RDWR, 0o600), None
+        except OSError:
+            # Filesystem without O_TMPFILE support
+            pass
+    return tempfile.mkstemp(suffix=suffix)
+
+
+def _discard_spool(fd: int, path: str | None) -> None:
+    """Drop a spool file opened by _open_spool() that will not be returned"""
+    if path is None:
+        os.close(fd)
+    else:
+        os.unlink(path)
+
+
+def split_colon(value: str | None) -> str | list[str] | None:
+    """
+    Split a colon-separated list such as a STEPLIB concatenation.
+
+    The common cases are handled without building a list: an unset value is
+    returned as None and a single entry is returned as the string itself,
+    which the API functions accept in place of a list.
+
+    Args:
+        value: Colon-separated string (e.g. 'DB2V13.SDSNLOAD:DB2V13.SDSNLOD2'),
+            or None
+
+    Returns:
+        None, the single entry, or a list of the entries in order
+    """
+    if not value:
+        return None
+    if ':' not in value:
+        return value
+    return value.split(':')
+
+
+def read_stdin() -> str | None:
+    """
+    Read all of stdin as text, for input that has to be processed as a string.
+
+    stdin is read as bytes and checked for content before it is decoded, so
+    blank input is rejected without a decode pass.
+
+    Returns:
+        The decoded contents of stdin, or None if it was empty or contained
+        only whitespace
+    """
+    stdin = sys.stdin.buffer
+    has_content = _head_has_content(stdin)
+    data = stdin.read()
+    if not has_content and not data.strip():
+        return None
+    return data.decode(sys.stdin.encoding or 'utf-8', sys.stdin.errors or 'strict')
+
+
+def _head_has_content(stream) -> bool:
+    """
+    Check the first HEAD_SIZE bytes of a buffered stream for non-whitespace
+    without consuming them.
+
+    Returns:
+        True if the head has content; False if it is blank or the stream
+        cannot be peeked, in which case the caller checks the data it reads
+    """
+    if not isinstance(stream, io.BufferedReader):
+        return False
+    return bool(stream.peek(HEAD_SIZE)[:HEAD_SIZE].strip())
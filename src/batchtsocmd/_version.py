@@ -0,0 +1,8 @@
+"""
+_version.py - Package version for batchtsocmd
+
+Kept separate from main.py so that --version and --help do not have to
+import the z/OS runtime dependencies.
+"""
+
+__version__ = "0.2.1"
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+cli.py - Run any of the batchtsocmd Db2 commands from a single entry point
+
+Each command is a subcommand sharing one parser, so a caller that runs several
+commands in-process builds the argument plumbing once:
+
+    python -m batchtsocmd.cli db2sql --file schema.sql
+    python -m batchtsocmd.cli db2op "-DISPLAY DATABASE(*)"
+
+The individual db2sql, db2op, db2bind and db2run console scripts are unchanged.
+"""
+
+import sys
+import argparse
+from . import db2_cli, db2admin_cli, db2bind_cli, db2op_cli, db2run_cli, db2sql_cli
+from ._version import __version__
+
+
+# Subcommand name -> CLI module providing _DESCRIPTION, _EPILOG,
+# _add_arguments() and _run()
+_COMMANDS = {
+    'db2sql': db2sql_cli,
+    'db2op': db2op_cli,
+    'db2bind': db2bind_cli,
+    'db2run': db2run_cli,
+    # Deprecated aliases
+    'db2cmd': db2_cli,
+    'db2admin': db2admin_cli,
+}
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subparser per command"""
+    parser = argparse.ArgumentParser(
+        prog='batchtsocmd.cli',
+        description='Run a batchtsocmd Db2 command'
+    )
+
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'%(prog)s {__version__}'
+    )
+
+    subparsers = parser.add_subparsers(dest='_command', metavar='COMMAND', required=True)
+    for name, module in _COMMANDS.items():
+        subparser = subparsers.add_parser(
+            name,
+            help=module._DESCRIPTION,
+            description=module._DESCRIPTION,
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=module._EPILOG
+        )
+        module._add_arguments(subparser)
+        subparser.set_defaults(_run=module._run)
+
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the dispatcher argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point: parse the subcommand and dispatch to it"""
+    args = _get_parser().parse_args(argv)
+    return args._run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -9,17 +9,28 @@ Use db2sql for all new code.
 
 import sys
 import os
+import stat
 import argparse
-import tempfile
-from .main import db2cmd, __version__
+from ._cliutil import (
+    ArgSpec,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    release_spool,
+    split_colon,
+    spool_stdin,
+    stdin_file,
+    usage_error,
+)
 
 
-def main():
-    """Main entry point for db2cmd command"""
-    parser = argparse.ArgumentParser(
-        description='Execute Db2 commands via DSNTEP2 with encoding conversion',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_DESCRIPTION = 'Execute Db2 commands via DSNTEP2 with encoding conversion'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_PLAN      - Default Db2 plan name
@@ -53,70 +64,64 @@ Note: Command line options override environment variables.
       Input can be from file (--sysin) or stdin (pipe).
       Output files will be tagged as IBM-1047.
 """
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    SYSTEM_ARG,
+    (('--plan',), {'help': 'Db2 plan name (or set DB2_PLAN env var)'}),
+    (('--toollib',), {'help': 'Db2 tool library (or set DB2_TOOLLIB env var)'}),
+    (('--sysin',), {'help': 'Path to SYSIN input file (if not specified, reads from stdin)'}),
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    (('--steplib',), {'help': 'Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets'}),
+    (('--dbrmlib',), {'help': 'Optional DBRMLIB dataset name(s) or directory. Use colon to concatenate multiple datasets (or set DB2_DBRMLIB env var)'}),
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2cmd command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2cmd command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
-    
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
-    
-    parser.add_argument(
-        '--plan',
-        help='Db2 plan name (or set DB2_PLAN env var)'
-    )
-    
-    parser.add_argument(
-        '--toollib',
-        help='Db2 tool library (or set DB2_TOOLLIB env var)'
-    )
-    
-    parser.add_argument(
-        '--sysin',
-        help='Path to SYSIN input file (if not specified, reads from stdin)'
-    )
-    
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets'
-    )
-    
-    parser.add_argument(
-        '--dbrmlib',
-        help='Optional DBRMLIB dataset name(s) or directory. Use colon to concatenate multiple datasets (or set DB2_DBRMLIB env var)'
-    )
-    
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
-    
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
-    
-    args = parser.parse_args()
+    _add_arguments(parser)
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2cmd argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point for db2cmd command"""
+    return _run(_get_parser().parse_args(argv))
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2cmd command with already-parsed arguments"""
     
     # Get parameters from command line or environment variables
     # Command line takes precedence
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    plan = args.plan or os.environ.get('DB2_PLAN')
-    toollib = args.toollib or os.environ.get('DB2_TOOLLIB')
-    dbrmlib_arg = args.dbrmlib or os.environ.get('DB2_DBRMLIB')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    plan = args.plan or env['DB2_PLAN']
+    toollib = args.toollib or env['DB2_TOOLLIB']
+    dbrmlib_arg = args.dbrmlib or env['DB2_DBRMLIB']
     
     # Validate required parameters
     missing_params = []
@@ -128,65 +133,69 @@ Note: Command line options override environment variables.
         missing_params.append('--toollib (or DB2_TOOLLIB env var)')
     
     if missing_params:
-        print(f"ERROR: Missing required parameters: {', '.join(missing_params)}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Missing required parameters: {', '.join(missing_params)}")
     
     # Handle SYSIN input
     temp_sysin = None
     sysin_file = None
-    sysin_content = None
     
     try:
         if args.sysin:
-            # Use file specified on command line
+            # Use file specified on command line (tsocmd validates it
+            # before reading, so it is not stat'ed here as well)
             sysin_file = args.sysin
-            if not os.path.exists(sysin_file):
-                print(f"ERROR: SYSIN file does not exist: {sysin_file}", file=sys.stderr)
-                return 8
         else:
             # Read from stdin
             if args.verbose:
                 print("Reading SYSIN from stdin...", file=sys.stderr)
             
-            stdin_content = sys.stdin.read()
-            if not stdin_content.strip():
+            # Read a redirected file in place; otherwise copy stdin to a
+            # temporary file without holding it in memory
+            sysin_file = stdin_file()
+            if sysin_file is None:
+                temp_sysin = spool_stdin()
+                sysin_file = temp_sysin
+            if sysin_file is None:
                 print("ERROR: No input provided via stdin", file=sys.stderr)
                 return 8
-            
-            # Create temporary file for stdin content
-            temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-            temp_sysin.write(stdin_content)
-            temp_sysin.close()
-            sysin_file = temp_sysin.name
         
         # Parse steplib and dbrmlib arguments (support colon-separated concatenation)
-        steplib_list = args.steplib.split(':') if args.steplib else None
+        steplib_list = split_colon(args.steplib)
         
         # Handle DBRMLIB - can be dataset(s) or directory
         dbrmlib_list = None
         if dbrmlib_arg:
-            # Check if it's a directory (contains slash) or dataset (no slash)
-            if '/' in dbrmlib_arg:
-                # It's a directory path - scan for .dbm files
-                if os.path.isdir(dbrmlib_arg):
-                    # Find all .dbm files in directory
-                    dbm_files = [f for f in os.listdir(dbrmlib_arg) if f.endswith('.dbm')]
-                    if dbm_files:
-                        # Convert file names to dataset names (remove .dbm extension)
-                        dbrmlib_list = [f[:-4] for f in dbm_files]
-                        if args.verbose:
-                            print(f"Found {len(dbrmlib_list)} DBRMLIB datasets in {dbrmlib_arg}", file=sys.stderr)
-                    else:
-                        if args.verbose:
-                            print(f"Warning: No .dbm files found in {dbrmlib_arg}", file=sys.stderr)
+            # One stat decides whether it's a directory or dataset name(s)
+            try:
+                dbrmlib_stat = os.stat(dbrmlib_arg)
+            except OSError:
+                dbrmlib_stat = None
+            
+            if dbrmlib_stat is not None and stat.S_ISDIR(dbrmlib_stat.st_mode):
+                # It's a directory - find all .dbm files and convert the file
+                # names to dataset names (remove .dbm extension) in a single
+                # scandir pass. Entries are matched by name only, as the
+                # original listdir() scan did, so no per-entry stat is made.
+                with os.scandir(dbrmlib_arg) as entries:
+                    dbm_names = [entry.name[:-4] for entry in entries
+                                 if entry.name.endswith('.dbm')]
+                if dbm_names:
+                    dbrmlib_list = dbm_names
+                    if args.verbose:
+                        print(f"Found {len(dbrmlib_list)} DBRMLIB datasets in {dbrmlib_arg}", file=sys.stderr)
                 else:
-                    print(f"ERROR: DBRMLIB directory does not exist: {dbrmlib_arg}", file=sys.stderr)
-                    return 8
+                    if args.verbose:
+                        print(f"Warning: No .dbm files found in {dbrmlib_arg}", file=sys.stderr)
+            elif '/' in dbrmlib_arg:
+                # A path that is not an existing directory
+                print(f"ERROR: DBRMLIB directory does not exist: {dbrmlib_arg}", file=sys.stderr)
+                return 8
             else:
                 # It's a dataset name or colon-separated list
-                dbrmlib_list = dbrmlib_arg.split(':')
+                dbrmlib_list = split_colon(dbrmlib_arg)
         
+        from .main import db2cmd
+
         # Execute the Db2 command
         rc = db2cmd(
             sysin_file=sysin_file,
@@ -212,8 +221,8 @@ Note: Command line options override environment variables.
         
     finally:
         # Clean up temporary stdin file
-        if temp_sysin and os.path.exists(temp_sysin.name):
-            os.unlink(temp_sysin.name)
+        if temp_sysin:
+            release_spool(temp_sysin)
 
 
 if __name__ == '__main__':
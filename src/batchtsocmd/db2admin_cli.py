@@ -8,18 +8,27 @@ Use db2op for all new code.
 """
 
 import sys
-import os
 import argparse
-import tempfile
-from .main import db2admin, __version__
+from ._cliutil import (
+    ArgSpec,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    release_spool,
+    split_colon,
+    spool_stdin,
+    stdin_file,
+    usage_error,
+)
 
 
-def main():
-    """Main entry point for db2admin command"""
-    parser = argparse.ArgumentParser(
-        description='Execute Db2 administrative commands via DSNTIAD with encoding conversion',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_DESCRIPTION = 'Execute Db2 administrative commands via DSNTIAD with encoding conversion'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_PLAN      - Default Db2 plan name
@@ -49,64 +58,62 @@ Note: Command line options override environment variables.
       Output files will be tagged as IBM-1047.
       DSNTIAD is used for DB2 administrative commands (DISPLAY, START, STOP, etc.)
 """
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    SYSTEM_ARG,
+    (('--plan',), {'help': 'Db2 plan name (or set DB2_PLAN env var)'}),
+    (('--toollib',), {'help': 'Db2 tool library (or set DB2_TOOLLIB env var)'}),
+    (('--sysin',), {'help': 'Path to SYSIN input file (if not specified, reads from stdin)'}),
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    (('--steplib',), {'help': 'Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets'}),
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2admin command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2admin command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
-    
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
-    
-    parser.add_argument(
-        '--plan',
-        help='Db2 plan name (or set DB2_PLAN env var)'
-    )
-    
-    parser.add_argument(
-        '--toollib',
-        help='Db2 tool library (or set DB2_TOOLLIB env var)'
-    )
-    
-    parser.add_argument(
-        '--sysin',
-        help='Path to SYSIN input file (if not specified, reads from stdin)'
-    )
-    
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets'
-    )
-    
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
-    
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
-    
-    args = parser.parse_args()
+    _add_arguments(parser)
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2admin argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point for db2admin command"""
+    return _run(_get_parser().parse_args(argv))
+
+
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2admin command with already-parsed arguments"""
     
     # Get parameters from command line or environment variables
     # Command line takes precedence
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    plan = args.plan or os.environ.get('DB2_PLAN')
-    toollib = args.toollib or os.environ.get('DB2_TOOLLIB')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    plan = args.plan or env['DB2_PLAN']
+    toollib = args.toollib or env['DB2_TOOLLIB']
     
     # Validate required parameters
     missing_params = []
@@ -118,41 +125,37 @@ Note: Command line options override environment variables.
         missing_params.append('--toollib (or DB2_TOOLLIB env var)')
     
     if missing_params:
-        print(f"ERROR: Missing required parameters: {', '.join(missing_params)}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Missing required parameters: {', '.join(missing_params)}")
     
     # Handle SYSIN input
     temp_sysin = None
     sysin_file = None
-    sysin_content = None
     
     try:
         if args.sysin:
-            # Use file specified on command line
+            # Use file specified on command line (tsocmd validates it
+            # before reading, so it is not stat'ed here as well)
             sysin_file = args.sysin
-            if not os.path.exists(sysin_file):
-                print(f"ERROR: SYSIN file does not exist: {sysin_file}", file=sys.stderr)
-                return 8
         else:
             # Read from stdin
             if args.verbose:
                 print("Reading SYSIN from stdin...", file=sys.stderr)
             
-            stdin_content = sys.stdin.read()
-            if not stdin_content.strip():
+            # Read a redirected file in place; otherwise copy stdin to a
+            # temporary file without holding it in memory
+            sysin_file = stdin_file()
+            if sysin_file is None:
+                temp_sysin = spool_stdin()
+                sysin_file = temp_sysin
+            if sysin_file is None:
                 print("ERROR: No input provided via stdin", file=sys.stderr)
                 return 8
-            
-            # Create temporary file for stdin content
-            temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-            temp_sysin.write(stdin_content)
-            temp_sysin.close()
-            sysin_file = temp_sysin.name
         
         # Parse steplib argument (support colon-separated concatenation)
-        steplib_list = args.steplib.split(':') if args.steplib else None
+        steplib_list = split_colon(args.steplib)
         
+        from .main import db2admin
+
         # Execute the Db2 administrative command
         rc = db2admin(
             sysin_file=sysin_file,
@@ -177,8 +180,8 @@ Note: Command line options override environment variables.
         
     finally:
         # Clean up temporary stdin file
-        if temp_sysin and os.path.exists(temp_sysin.name):
-            os.unlink(temp_sysin.name)
+        if temp_sysin:
+            release_spool(temp_sysin)
 
 
 if __name__ == '__main__':
@@ -7,15 +7,25 @@ Command-line interface for db2bind functionality
 import sys
 import os
 import argparse
-from .main import db2bind, __version__
-
-
-def main():
-    """Main entry point for db2bind command"""
-    parser = argparse.ArgumentParser(
-        description='Bind Db2 packages and plans via DSN BIND subcommands',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+from ._cliutil import (
+    ArgSpec,
+    DEBUG_ARG,
+    STEPLIB_ARG,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    split_colon,
+    usage_error,
+)
+
+
+_DESCRIPTION = 'Bind Db2 packages and plans via DSN BIND subcommands'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_STEPLIB   - Default STEPLIB dataset(s)
@@ -56,114 +66,90 @@ Note: Command line options override environment variables.
       No SYSIN SQL input is used - all parameters are on the BIND subcommands.
       Use --library for filesystem DBRMs or --dbrmlib for dataset DBRMs (mutually exclusive).
 """
-    )
-
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
-
-    parser.add_argument(
-        '--package',
-        help='Package collection name for BIND PACKAGE (e.g. PCBSA)'
-    )
 
-    parser.add_argument(
-        '--plan',
-        help='Plan name for BIND PLAN (e.g. CBSA)'
-    )
-
-    parser.add_argument(
-        '--member',
-        action='append',
-        dest='members',
-        metavar='MEMBER',
-        help='DBRM member name to bind as a package. Repeat for multiple members.'
-    )
-
-    parser.add_argument(
-        '--owner',
-        help='OWNER for BIND subcommands'
-    )
-
-    parser.add_argument(
-        '--qualifier',
-        help='QUALIFIER for BIND subcommands'
-    )
-
-    parser.add_argument(
-        '--action',
-        default='REPLACE',
-        choices=['ADD', 'REPLACE'],
-        help='BIND action: ADD or REPLACE (default: REPLACE)'
-    )
-
-    parser.add_argument(
-        '--isolation',
-        choices=['UR', 'CS', 'RS', 'RR'],
-        help='Isolation level for BIND PLAN (e.g. UR, CS, RS, RR)'
-    )
-
-    parser.add_argument(
-        '--pklist',
-        action='append',
-        dest='pklist',
-        metavar='ENTRY',
-        help='Package list entry for BIND PLAN PKLIST. Repeat for multiple entries.'
-    )
-
-    parser.add_argument(
-        '--dbrmlib',
-        help='DBRMLIB dataset name(s). Use colon to concatenate (or set DB2_DBRMLIB env var)'
-    )
-
-    parser.add_argument(
-        '--library',
-        help='USS filesystem directory containing DBRM files (or set DB2_LIBRARY env var). Mutually exclusive with --dbrmlib'
-    )
-
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate (or set DB2_STEPLIB env var)'
+_PARSER: argparse.ArgumentParser | None = None
+
+# Values accepted by --action and --isolation
+_ACTIONS = frozenset({'ADD', 'REPLACE'})
+_ISOLATIONS = frozenset({'UR', 'CS', 'RS', 'RR'})
+
+
+def _action(value: str) -> str:
+    """Validate a --action value (case-insensitive) and return it in upper case"""
+    action = value.upper()
+    if action not in _ACTIONS:
+        raise argparse.ArgumentTypeError(f"invalid choice: '{value}' (choose from ADD, REPLACE)")
+    return action
+
+
+def _isolation(value: str) -> str:
+    """Validate an --isolation value (case-insensitive) and return it in upper case"""
+    isolation = value.upper()
+    if isolation not in _ISOLATIONS:
+        raise argparse.ArgumentTypeError(f"invalid choice: '{value}' (choose from UR, CS, RS, RR)")
+    return isolation
+
+
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    SYSTEM_ARG,
+    (('--package',), {'help': 'Package collection name for BIND PACKAGE (e.g. PCBSA)'}),
+    (('--plan',), {'help': 'Plan name for BIND PLAN (e.g. CBSA)'}),
+    (('--member',), {'action': 'append', 'dest': 'members', 'metavar': 'MEMBER', 'help': 'DBRM member name to bind as a package. Repeat for multiple members.'}),
+    (('--owner',), {'help': 'OWNER for BIND subcommands'}),
+    (('--qualifier',), {'help': 'QUALIFIER for BIND subcommands'}),
+    (('--action',), {'default': 'REPLACE', 'type': _action, 'metavar': '{ADD,REPLACE}', 'help': 'BIND action: ADD or REPLACE (default: REPLACE)'}),
+    (('--isolation',), {'type': _isolation, 'metavar': '{UR,CS,RS,RR}', 'help': 'Isolation level for BIND PLAN (e.g. UR, CS, RS, RR)'}),
+    (('--pklist',), {'action': 'append', 'dest': 'pklist', 'metavar': 'ENTRY', 'help': 'Package list entry for BIND PLAN PKLIST. Repeat for multiple entries.'}),
+    (('--dbrmlib',), {'help': 'DBRMLIB dataset name(s). Use colon to concatenate (or set DB2_DBRMLIB env var)'}),
+    (('--library',), {'help': 'USS filesystem directory containing DBRM files (or set DB2_LIBRARY env var). Mutually exclusive with --dbrmlib'}),
+    STEPLIB_ARG,
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    DEBUG_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2bind command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2bind command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
+    _add_arguments(parser)
+    return parser
 
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
-    )
 
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2bind argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
 
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Preserve temporary files for debugging (do not delete SYSTSIN, SYSIN, SYSTSPRT, SYSPRINT)'
-    )
 
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
+def main(argv: list[str] | None = None):
+    """Main entry point for db2bind command"""
+    return _run(_get_parser().parse_args(argv))
 
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
 
-    args = parser.parse_args()
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2bind command with already-parsed arguments"""
 
     # Resolve parameters: CLI > env vars
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    steplib_arg = args.steplib or os.environ.get('DB2_STEPLIB')
-    dbrmlib_arg = args.dbrmlib or os.environ.get('DB2_DBRMLIB')
-    library_arg = args.library or os.environ.get('DB2_LIBRARY')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    steplib_arg = args.steplib or env['DB2_STEPLIB']
+    dbrmlib_arg = args.dbrmlib or env['DB2_DBRMLIB']
+    library_arg = args.library or env['DB2_LIBRARY']
 
     # Validate required parameters
     missing_params = []
@@ -171,38 +157,30 @@ Note: Command line options override environment variables.
         missing_params.append('--system (or DB2_SYSTEM env var)')
 
     if missing_params:
-        print(f"ERROR: Missing required parameters: {', '.join(missing_params)}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Missing required parameters: {', '.join(missing_params)}")
 
     # Validate mutual exclusivity of dbrmlib and library
     if dbrmlib_arg and library_arg:
-        print("ERROR: --dbrmlib and --library are mutually exclusive. Use one or the other.", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error("--dbrmlib and --library are mutually exclusive. Use one or the other.")
 
     # Validate library path exists if specified
     if library_arg and not os.path.isdir(library_arg):
-        print(f"ERROR: Library directory does not exist: {library_arg}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Library directory does not exist: {library_arg}")
 
     # Validate that at least package or plan is specified
     if not args.package and not args.plan:
-        print("ERROR: At least one of --package or --plan must be specified", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error("At least one of --package or --plan must be specified")
 
     # Validate that members are provided when package is specified
     if args.package and not args.members:
-        print("ERROR: --member is required when --package is specified", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error("--member is required when --package is specified")
 
     try:
         # Parse steplib and dbrmlib (colon-separated)
-        steplib_list = steplib_arg.split(':') if steplib_arg else None
-        dbrmlib_list = dbrmlib_arg.split(':') if dbrmlib_arg else None
+        steplib_list = split_colon(steplib_arg)
+        dbrmlib_list = split_colon(dbrmlib_arg)
+
+        from .main import db2bind
 
         rc = db2bind(
             system=system,
@@ -7,16 +7,26 @@ Command-line interface for db2op functionality
 import sys
 import os
 import argparse
-import tempfile
-from .main import db2op, __version__
-
-
-def main():
-    """Main entry point for db2op command"""
-    parser = argparse.ArgumentParser(
-        description='Execute Db2 operator commands via DSNTIAD (-DISPLAY, -START, -STOP, etc.)',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+from ._cliutil import (
+    ArgSpec,
+    DEBUG_ARG,
+    STEPLIB_ARG,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    read_stdin,
+    split_colon,
+    usage_error,
+)
+
+
+_DESCRIPTION = 'Execute Db2 operator commands via DSNTIAD (-DISPLAY, -START, -STOP, etc.)'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_PLAN      - Default Db2 plan name for DSNTIAD
@@ -43,77 +53,64 @@ Note: Command line options override environment variables.
       added automatically if missing.
       Input can be inline, from --file, or from stdin.
 """
-    )
 
-    parser.add_argument(
-        'command',
-        nargs='?',
-        help='Db2 operator command to execute (inline). The leading \'-\' is optional.'
-    )
+_PARSER: argparse.ArgumentParser | None = None
 
-    parser.add_argument(
-        '--file', '-f',
-        dest='sysin',
-        help='Path to file containing operator commands (mutually exclusive with inline command and stdin)'
-    )
 
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    (('command',), {'nargs': '?', 'help': 'Db2 operator command to execute (inline). The leading \'-\' is optional.'}),
+    (('--file', '-f'), {'dest': 'sysin', 'help': 'Path to file containing operator commands (mutually exclusive with inline command and stdin)'}),
+    SYSTEM_ARG,
+    (('--plan',), {'help': 'Db2 plan name for DSNTIAD (or set DB2_PLAN env var)'}),
+    (('--toollib',), {'help': 'Db2 tool library containing DSNTIAD (or set DB2_TOOLLIB env var)'}),
+    STEPLIB_ARG,
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    DEBUG_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
 
-    parser.add_argument(
-        '--plan',
-        help='Db2 plan name for DSNTIAD (or set DB2_PLAN env var)'
-    )
 
-    parser.add_argument(
-        '--toollib',
-        help='Db2 tool library containing DSNTIAD (or set DB2_TOOLLIB env var)'
-    )
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2op command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
 
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate (or set DB2_STEPLIB env var)'
-    )
 
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2op command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
+    _add_arguments(parser)
+    return parser
 
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
 
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Preserve temporary files for debugging (do not delete SYSTSIN, SYSIN, SYSTSPRT, SYSPRINT)'
-    )
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2op argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
 
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
 
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
+def main(argv: list[str] | None = None):
+    """Main entry point for db2op command"""
+    return _run(_get_parser().parse_args(argv))
 
-    args = parser.parse_args()
+
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2op command with already-parsed arguments"""
 
     # Resolve parameters: CLI > env vars
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    plan = args.plan or os.environ.get('DB2_PLAN')
-    toollib = args.toollib or os.environ.get('DB2_TOOLLIB')
-    steplib_arg = args.steplib or os.environ.get('DB2_STEPLIB')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    plan = args.plan or env['DB2_PLAN']
+    toollib = args.toollib or env['DB2_TOOLLIB']
+    steplib_arg = args.steplib or env['DB2_STEPLIB']
 
     # Validate required parameters
     missing_params = []
@@ -125,9 +122,7 @@ Note: Command line options override environment variables.
         missing_params.append('--toollib (or DB2_TOOLLIB env var)')
 
     if missing_params:
-        print(f"ERROR: Missing required parameters: {', '.join(missing_params)}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Missing required parameters: {', '.join(missing_params)}")
 
     # Determine input source: inline > --file > stdin
     sysin_content = None
@@ -149,14 +144,15 @@ Note: Command line options override environment variables.
             # Read from stdin
             if args.verbose:
                 print("Reading operator commands from stdin...", file=sys.stderr)
-            stdin_content = sys.stdin.read()
-            if not stdin_content.strip():
+            sysin_content = read_stdin()
+            if sysin_content is None:
                 print("ERROR: No operator command provided via stdin", file=sys.stderr)
                 return 8
-            sysin_content = stdin_content
 
         # Parse steplib (colon-separated)
-        steplib_list = steplib_arg.split(':') if steplib_arg else None
+        steplib_list = split_colon(steplib_arg)
+
+        from .main import db2op
 
         rc = db2op(
             sysin_content=sysin_content,
@@ -5,17 +5,26 @@ Command-line interface for db2run functionality
 """
 
 import sys
-import os
 import argparse
-from .main import db2run, __version__
-
-
-def main():
-    """Main entry point for db2run command"""
-    parser = argparse.ArgumentParser(
-        description='Run a Db2-bound program via DSN RUN PROGRAM via IKJEFT1B',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+from ._cliutil import (
+    ArgSpec,
+    DEBUG_ARG,
+    STEPLIB_ARG,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    split_colon,
+    usage_error,
+)
+
+
+_DESCRIPTION = 'Run a Db2-bound program via DSN RUN PROGRAM via IKJEFT1B'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_STEPLIB   - Default STEPLIB dataset(s)
@@ -40,86 +49,72 @@ Note: Command line options override environment variables.
       No SYSIN SQL input is used - all parameters are on the RUN PROGRAM subcommand.
       Use --parm to pass a PARM string to the program.
 """
-    )
 
-    parser.add_argument(
-        '--program',
-        required=True,
-        help='Name of the Db2-bound program to run (required)'
-    )
+_PARSER: argparse.ArgumentParser | None = None
 
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
 
-    parser.add_argument(
-        '--plan',
-        required=True,
-        help='Db2 plan name bound for the program (required)'
-    )
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    (('--program',), {'required': True, 'help': 'Name of the Db2-bound program to run (required)'}),
+    SYSTEM_ARG,
+    (('--plan',), {'required': True, 'help': 'Db2 plan name bound for the program (required)'}),
+    (('--toollib',), {'required': True, 'help': 'Load library containing the program (required)'}),
+    (('--parm',), {'help': 'Optional PARM string to pass to the program'}),
+    STEPLIB_ARG,
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    DEBUG_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
 
-    parser.add_argument(
-        '--toollib',
-        required=True,
-        help='Load library containing the program (required)'
-    )
 
-    parser.add_argument(
-        '--parm',
-        help='Optional PARM string to pass to the program'
-    )
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2run command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
 
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate (or set DB2_STEPLIB env var)'
-    )
 
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2run command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
+    _add_arguments(parser)
+    return parser
 
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
 
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Preserve temporary files for debugging (do not delete SYSTSIN, SYSIN, SYSTSPRT, SYSPRINT)'
-    )
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2run argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
 
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
 
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
+def main(argv: list[str] | None = None):
+    """Main entry point for db2run command"""
+    return _run(_get_parser().parse_args(argv))
 
-    args = parser.parse_args()
+
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2run command with already-parsed arguments"""
 
     # Resolve parameters: CLI > env vars
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    steplib_arg = args.steplib or os.environ.get('DB2_STEPLIB')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    steplib_arg = args.steplib or env['DB2_STEPLIB']
 
     # Validate required parameters
     if not system:
-        print("ERROR: Missing required parameter: --system (or DB2_SYSTEM env var)", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error("Missing required parameter: --system (or DB2_SYSTEM env var)")
 
     try:
         # Parse steplib (colon-separated)
-        steplib_list = steplib_arg.split(':') if steplib_arg else None
+        steplib_list = split_colon(steplib_arg)
+
+        from .main import db2run
 
         rc = db2run(
             program=args.program,
@@ -7,16 +7,28 @@ Command-line interface for db2sql functionality
 import sys
 import os
 import argparse
-import tempfile
-from .main import db2sql, __version__
-
-
-def main():
-    """Main entry point for db2sql command"""
-    parser = argparse.ArgumentParser(
-        description='Execute SQL statements via DSNTEP2 (DDL, DML, DQL, GRANT)',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+from ._cliutil import (
+    ArgSpec,
+    DEBUG_ARG,
+    STEPLIB_ARG,
+    SYSPRINT_ARG,
+    SYSTEM_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    db2_env,
+    release_spool,
+    split_colon,
+    spool_stdin,
+    stdin_file,
+    usage_error,
+)
+
+
+_DESCRIPTION = 'Execute SQL statements via DSNTEP2 (DDL, DML, DQL, GRANT)'
+
+_EPILOG = """
 Environment Variables:
   DB2_SYSTEM    - Default Db2 subsystem ID
   DB2_PLAN      - Default Db2 plan name for DSNTEP2
@@ -47,77 +59,132 @@ Note: Command line options override environment variables.
       Input can be inline SQL, from --file, or from stdin.
       Multiple SQL statements must be separated by semicolons.
 """
-    )
-
-    parser.add_argument(
-        'sql',
-        nargs='?',
-        help='SQL statement(s) to execute (inline). Separate multiple statements with semicolons.'
-    )
-
-    parser.add_argument(
-        '--file', '-f',
-        dest='sysin',
-        help='Path to SQL input file (mutually exclusive with inline SQL and stdin)'
-    )
 
-    parser.add_argument(
-        '--system',
-        help='Db2 subsystem ID (or set DB2_SYSTEM env var)'
-    )
+_PARSER: argparse.ArgumentParser | None = None
 
-    parser.add_argument(
-        '--plan',
-        help='Db2 plan name for DSNTEP2 (or set DB2_PLAN env var, defaults to DSNTEP2)'
-    )
-
-    parser.add_argument(
-        '--toollib',
-        help='Db2 tool library containing DSNTEP2 (or set DB2_TOOLLIB env var)'
-    )
 
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate (or set DB2_STEPLIB env var)'
+def _batch_size(value: str) -> int:
+    """Validate a --batch-size value"""
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise argparse.ArgumentTypeError(f"invalid batch size: '{value}' (must be 0 or a positive integer)")
+    return size
+
+
+def _split_statements(sql: str) -> list[str]:
+    """
+    Split SQL into statements at semicolons outside quotes and comments.
+
+    Each statement keeps its terminating semicolon and surrounding text, so
+    joining consecutive statements reproduces the original input. Trailing
+    text with no SQL in it is not a statement of its own: comments there
+    are kept with the last statement, and whitespace alone is dropped.
+
+    Args:
+        sql: SQL text containing one or more statements
+
+    Returns:
+        List of statements in input order
+    """
+    statements = []
+    start = 0
+    has_sql = False
+    quote = None
+    i = 0
+    length = len(sql)
+    while i < length:
+        char = sql[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char == "'" or char == '"':
+            quote = char
+            has_sql = True
+        elif char == '-' and sql.startswith('--', i):
+            # Skip to end of line so quotes and semicolons in comments are ignored
+            end = sql.find('\n', i)
+            i = length if end < 0 else end
+            continue
+        elif char == '/' and sql.startswith('/*', i):
+            # Likewise skip past the end of a block comment
+            end = sql.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            continue
+        elif char == ';':
+            statements.append(sql[start:i + 1])
+            start = i + 1
+            has_sql = False
+        elif not char.isspace():
+            has_sql = True
+        i += 1
+
+    tail = sql[start:]
+    if has_sql:
+        statements.append(tail)
+    elif statements and tail.strip():
+        statements[-1] += tail
+
+    return statements
+
+
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    (('sql',), {'nargs': '?', 'help': 'SQL statement(s) to execute (inline). Separate multiple statements with semicolons.'}),
+    (('--file', '-f'), {'dest': 'sysin', 'help': 'Path to SQL input file (mutually exclusive with inline SQL and stdin)'}),
+    SYSTEM_ARG,
+    (('--plan',), {'help': 'Db2 plan name for DSNTEP2 (or set DB2_PLAN env var, defaults to DSNTEP2)'}),
+    (('--toollib',), {'help': 'Db2 tool library containing DSNTEP2 (or set DB2_TOOLLIB env var)'}),
+    STEPLIB_ARG,
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    (('--batch-size',), {'type': _batch_size, 'default': 0, 'metavar': 'N', 'help': 'Run the SQL in batches of N statements, one DSNTEP2 invocation per batch (default: 0, all statements in one invocation)'}),
+    DEBUG_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
+
+
+def _add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the db2sql command's arguments to parser"""
+    add_arguments(parser, _ARGUMENTS)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the db2sql command"""
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
+    _add_arguments(parser)
+    return parser
 
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
-    )
 
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the db2sql argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
 
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Preserve temporary files for debugging (do not delete SYSTSIN, SYSIN, SYSTSPRT, SYSPRINT)'
-    )
 
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
+def main(argv: list[str] | None = None):
+    """Main entry point for db2sql command"""
+    return _run(_get_parser().parse_args(argv))
 
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
 
-    args = parser.parse_args()
+def _run(args: argparse.Namespace) -> int:
+    """Run the db2sql command with already-parsed arguments"""
 
     # Resolve parameters: CLI > env vars > defaults
-    system = args.system or os.environ.get('DB2_SYSTEM')
-    plan = args.plan or os.environ.get('DB2_PLAN') or 'DSNTEP2'
-    toollib = args.toollib or os.environ.get('DB2_TOOLLIB')
-    steplib_arg = args.steplib or os.environ.get('DB2_STEPLIB')
+    env = db2_env()
+    system = args.system or env['DB2_SYSTEM']
+    plan = args.plan or env['DB2_PLAN'] or 'DSNTEP2'
+    toollib = args.toollib or env['DB2_TOOLLIB']
+    steplib_arg = args.steplib or env['DB2_STEPLIB']
 
     # Validate required parameters
     missing_params = []
@@ -127,9 +194,11 @@ Note: Command line options override environment variables.
         missing_params.append('--toollib (or DB2_TOOLLIB env var)')
 
     if missing_params:
-        print(f"ERROR: Missing required parameters: {', '.join(missing_params)}", file=sys.stderr)
-        print("\nUse --help for usage information", file=sys.stderr)
-        return 1
+        return usage_error(f"Missing required parameters: {', '.join(missing_params)}")
+
+    # Each batch rewrites named output files, so batches need stdout
+    if args.batch_size and (args.systsprt != 'stdout' or args.sysprint != 'stdout'):
+        return usage_error("--batch-size requires --systsprt and --sysprint to be stdout")
 
     # Determine SQL input source: inline > --file > stdin
     temp_sysin = None
@@ -145,34 +214,76 @@ Note: Command line options override environment variables.
             sysin_content = args.sql
         elif args.sysin:
             sysin_file = args.sysin
-            if not os.path.exists(sysin_file):
+            try:
+                sysin_size = os.stat(sysin_file).st_size
+            except FileNotFoundError:
                 print(f"ERROR: SQL file does not exist: {sysin_file}", file=sys.stderr)
                 return 8
+            except OSError as e:
+                print(f"ERROR: cannot read SQL file {sysin_file}: {e}", file=sys.stderr)
+                return 8
+            if sysin_size == 0:
+                print(f"ERROR: SQL file is empty: {sysin_file}", file=sys.stderr)
+                return 8
         else:
             # Read from stdin
             if args.verbose:
                 print("Reading SQL from stdin...", file=sys.stderr)
-            stdin_content = sys.stdin.read()
-            if not stdin_content.strip():
+            # Pass stdin through as a file rather than reading it into memory
+            sysin_file = stdin_file()
+            if sysin_file is None:
+                temp_sysin = spool_stdin()
+                sysin_file = temp_sysin
+            if sysin_file is None:
                 print("ERROR: No SQL input provided via stdin", file=sys.stderr)
                 return 8
-            sysin_content = stdin_content
 
         # Parse steplib (colon-separated)
-        steplib_list = steplib_arg.split(':') if steplib_arg else None
-
-        rc = db2sql(
-            sysin_content=sysin_content,
-            sysin_file=sysin_file,
-            system=system,
-            plan=plan,
-            toollib=toollib,
-            steplib=steplib_list,
-            systsprt_file=args.systsprt,
-            sysprint_file=args.sysprint,
-            debug=args.debug,
-            verbose=args.verbose
-        )
+        steplib_list = split_colon(steplib_arg)
+
+        from .main import db2sql, read_sysin_text
+
+        if not args.batch_size:
+            return db2sql(
+                sysin_content=sysin_content,
+                sysin_file=sysin_file,
+                system=system,
+                plan=plan,
+                toollib=toollib,
+                steplib=steplib_list,
+                systsprt_file=args.systsprt,
+                sysprint_file=args.sysprint,
+                debug=args.debug,
+                verbose=args.verbose
+            )
+
+        # Batched: split into statements and run each group of up to
+        # --batch-size statements in its own DSNTEP2 invocation
+        if sysin_content is None:
+            sysin_content = read_sysin_text(sysin_file, args.verbose)  # type: ignore
+            if sysin_content is None:
+                return 8
+        statements = _split_statements(sysin_content)
+        if not statements:
+            print("ERROR: No SQL statements provided", file=sys.stderr)
+            return 8
+
+        rc = 0
+        for first in range(0, len(statements), args.batch_size):
+            batch = statements[first:first + args.batch_size]
+            if args.verbose:
+                print(f"Running statements {first + 1}-{first + len(batch)} of {len(statements)}", file=sys.stderr)
+            rc = max(rc, db2sql(
+                sysin_content=''.join(batch),
+                system=system,
+                plan=plan,
+                toollib=toollib,
+                steplib=steplib_list,
+                systsprt_file=args.systsprt,
+                sysprint_file=args.sysprint,
+                debug=args.debug,
+                verbose=args.verbose
+            ))
 
         return rc
 
@@ -185,8 +296,8 @@ Note: Command line options override environment variables.
         return 16
 
     finally:
-        if temp_sysin and os.path.exists(temp_sysin.name):
-            os.unlink(temp_sysin.name)
+        if temp_sysin:
+            release_spool(temp_sysin)
 
 
 if __name__ == '__main__':
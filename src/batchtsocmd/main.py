@@ -6,33 +6,151 @@ Handles SYSIN and SYSTSIN inputs with ASCII/EBCDIC conversion
 
 import sys
 import os
-import argparse
-import tempfile
-from zoautil_py import mvscmd
-from zoautil_py.ztypes import DDStatement, FileDefinition, DatasetDefinition
-
-# Check zos-ccsid-converter version
-try:
-    import zos_ccsid_converter
-    from packaging import version as pkg_version
-    
-    required_version = "0.1.8"
-    installed_version = getattr(zos_ccsid_converter, '__version__', '0.0.0')
-    
-    if pkg_version.parse(installed_version) < pkg_version.parse(required_version):
-        print(f"ERROR: zos-ccsid-converter version {required_version} or higher is required, "
-              f"but version {installed_version} is installed.", file=sys.stderr)
-        print(f"Please upgrade: pip install --upgrade 'zos-ccsid-converter>={required_version}'", file=sys.stderr)
-        sys.exit(1)
-except ImportError as e:
-    print(f"ERROR: Failed to import zos-ccsid-converter: {e}", file=sys.stderr)
-    print(f"Please install: pip install 'zos-ccsid-converter>=0.1.8'", file=sys.stderr)
-    sys.exit(1)
+import atexit
+import codecs
+import functools
+import itertools
+import threading
+from typing import IO, TYPE_CHECKING, Callable, Iterable
+from ._cliutil import (
+    ArgSpec,
+    SYSPRINT_ARG,
+    SYSTSPRT_ARG,
+    VERBOSE_ARG,
+    VERSION_ARG,
+    add_arguments,
+    split_colon,
+)
+from ._version import __version__
+
+# zoautil_py and zos_ccsid_converter, and the standard library modules only
+# some paths need (argparse, tempfile, shutil, subprocess), are imported on
+# first use, so that importing this module stays cheap
+if TYPE_CHECKING:
+    import argparse
+    import re
+    from zos_ccsid_converter import CodePageService
+
+# Directory for temporary work files: BATCHTSO_TMPDIR if set (e.g. a
+# memory-backed file system), otherwise tempfile's default (TMPDIR or /tmp)
+_TMPDIR = os.environ.get('BATCHTSO_TMPDIR') or None
+
+# Process-wide directory for work files, created on first use
+_scratch_dir: str | None = None
+_scratch_count = itertools.count()
+
+
+def _scratch_file(suffix: str, buffering: int = -1) -> IO[bytes]:
+    """
+    Create a new, empty work file in the process-wide scratch directory.
 
-from zos_ccsid_converter import CodePageService
+    The directory is created once, so each work file needs only an exclusive
+    open rather than a mkstemp() call. Files are removed by their callers as
+    before (or kept in debug mode); the directory itself is removed at exit
+    if it is empty.
 
-# Package version
-__version__ = "0.2.0"
+    Args:
+        suffix: File name suffix (e.g. '.sysin')
+        buffering: Buffering policy, as for open()
+
+    Returns:
+        The file, open for binary writing
+    """
+    global _scratch_dir
+    if _scratch_dir is None:
+        import tempfile
+        _scratch_dir = tempfile.mkdtemp(prefix='batchtso_', dir=_TMPDIR)
+        atexit.register(_remove_scratch_dir, _scratch_dir)
+    name = f"{os.getpid()}.{next(_scratch_count)}{suffix}"
+    return open(os.path.join(_scratch_dir, name), 'xb', buffering=buffering)
+
+
+# Most generated SYSTSIN work files kept for reuse; adding another removes
+# the least recently used one
+SYSTSIN_CACHE_SIZE = 32
+
+# Generated SYSTSIN work files by content, least recently used first
+_systsin_files: dict[str, str] = {}
+_systsin_lock = threading.Lock()
+
+
+def _systsin_work_file(content: str, debug: bool = False) -> str:
+    """
+    Return an IBM-1047 SYSTSIN work file holding content.
+
+    Generated SYSTSIN depends only on a command's parameters, so repeated
+    calls (e.g. db2sql --batch-size, or a script running many statements)
+    usually need the same file. It is written on first use and reused while
+    it is one of the SYSTSIN_CACHE_SIZE most recently used; the rest are
+    removed at exit. In debug mode a new file is written on every call and
+    kept after exit.
+
+    Args:
+        content: SYSTSIN text
+        debug: Write a separate file that is not removed
+
+    Returns:
+        Path to the work file
+    """
+    if debug:
+        return _write_systsin(content)
+
+    with _systsin_lock:
+        path = _systsin_files.pop(content, None)
+        # A file removed behind our back is written again
+        if path is None or not os.path.exists(path):
+            path = _write_systsin(content)
+        # (Re)inserted as the most recently used
+        _systsin_files[content] = path
+        while len(_systsin_files) > SYSTSIN_CACHE_SIZE:
+            _unlink_if_exists(_systsin_files.pop(next(iter(_systsin_files))))
+    return path
+
+
+def _write_systsin(content: str) -> str:
+    """Write content to a new IBM-1047 SYSTSIN work file and return its path"""
+    f = _scratch_file('.systsin')
+    try:
+        with f:
+            f.write(encode_ebcdic(content))
+            tag_temp_file(f)
+    except BaseException:
+        # Not yet known to the cleanup at exit, so removed here; otherwise
+        # it would also keep the scratch directory from being removed
+        os.unlink(f.name)
+        raise
+    return f.name
+
+
+def _remove_systsin_files() -> None:
+    """Remove the reused SYSTSIN work files"""
+    with _systsin_lock:
+        for path in _systsin_files.values():
+            _unlink_if_exists(path)
+        _systsin_files.clear()
+
+
+def _unlink_if_exists(path: str) -> None:
+    """Delete a file, ignoring one that is already gone"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_work_file(work_file: IO | None) -> None:
+    """Delete a work file if it was created and still exists"""
+    if work_file is not None:
+        _unlink_if_exists(work_file.name)
+
+
+def _remove_scratch_dir(path: str) -> None:
+    """Remove the scratch directory unless it still holds debug files"""
+    _remove_systsin_files()
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
 
 
 def version() -> str:
@@ -45,25 +163,85 @@ def version() -> str:
     return __version__
 
 
-def convert_to_ebcdic(input_path: str, output_path: str, verbose: bool = False) -> bool:
+@functools.lru_cache(maxsize=None)
+def _load_converter() -> type['CodePageService']:
+    """
+    Import zos_ccsid_converter and check its version, once per process.
+
+    Returns:
+        The CodePageService class
+    """
+    # Check zos-ccsid-converter version
+    try:
+        import zos_ccsid_converter
+        from packaging import version as pkg_version
+        
+        required_version = "0.1.8"
+        installed_version = getattr(zos_ccsid_converter, '__version__', '0.0.0')
+        
+        if pkg_version.parse(installed_version) < pkg_version.parse(required_version):
+            print(f"ERROR: zos-ccsid-converter version {required_version} or higher is required, "
+                  f"but version {installed_version} is installed.", file=sys.stderr)
+            print(f"Please upgrade: pip install --upgrade 'zos-ccsid-converter>={required_version}'", file=sys.stderr)
+            sys.exit(1)
+    except ImportError as e:
+        print(f"ERROR: Failed to import zos-ccsid-converter: {e}", file=sys.stderr)
+        print(f"Please install: pip install 'zos-ccsid-converter>=0.1.8'", file=sys.stderr)
+        sys.exit(1)
+    
+    return zos_ccsid_converter.CodePageService
+
+
+@functools.lru_cache(maxsize=2)
+def _get_service(verbose: bool) -> 'CodePageService':
+    """Return the CodePageService for the given verbosity, creating it on first use"""
+    return _load_converter()(verbose=verbose)
+
+
+def convert_to_ebcdic(input_path: str, output_path: str, verbose: bool = False,
+                      source_encoding: str | None = None) -> bool:
     """
     Convert input file from ASCII to EBCDIC if needed using zos-ccsid-converter package.
-    If already EBCDIC or untagged (assumed EBCDIC), copy as-is.
+    If already EBCDIC or untagged (assumed EBCDIC), copy as-is; a file tagged
+    IBM-1047 is copied directly without calling the converter.
     
     Args:
         input_path: Source file path
         output_path: Destination file path
         verbose: Enable verbose output
+        source_encoding: Encoding of the input if known, or None to detect it.
+            'ascii' converts directly with a translation table, without
+            encoding detection (e.g. for SYSTSIN generated by this module)
     
     Returns:
         True if successful, False otherwise
     """
     try:
+        if source_encoding == 'ascii':
+            with open(input_path, 'rb') as infile:
+                data = infile.read()
+            if data.isascii():
+                with open(output_path, 'wb') as outfile:
+                    outfile.write(data.translate(_ascii_to_ibm1047()))
+                    tag_temp_file(outfile)
+                if verbose:
+                    print(f"Converted {input_path} from ASCII to EBCDIC")
+                return True
+            # Not ASCII after all: fall back to detection
+            source_encoding = None
+        
+        # Input tagged IBM-1047 needs no conversion: copy it without the
+        # converter's detection pass
+        if source_encoding in (None, 'IBM-1047') and _copy_if_ibm1047(input_path, output_path):
+            if verbose:
+                print(f"File {input_path} already in EBCDIC format, copied as-is")
+            return True
+        
         # Use the published zos-ccsid-converter package
-        service = CodePageService(verbose=verbose)
+        service = _get_service(verbose)
         
         stats = service.convert_input(input_path, output_path,
-                                      source_encoding=None,
+                                      source_encoding=source_encoding,
                                       target_encoding='IBM-1047')
         
         if not stats['success']:
@@ -84,6 +262,156 @@ def convert_to_ebcdic(input_path: str, output_path: str, verbose: bool = False)
         return False
 
 
+# Size of each copy when sendfile() is not available
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def _copy_if_ibm1047(input_path: str, output_path: str) -> bool:
+    """
+    Copy a file unchanged if it is tagged IBM-1047.
+
+    The copy is done in the kernel with sendfile() where available, otherwise
+    in large buffered chunks. The output is tagged IBM-1047.
+
+    Args:
+        input_path: Source file path
+        output_path: Destination file path
+
+    Returns:
+        True if the file was copied, False if it is not tagged IBM-1047 (or
+        the tag cannot be read) and still needs converting
+    """
+    getfdccsid = _getfdccsid()
+    if getfdccsid is None:
+        return False
+    
+    with open(input_path, 'rb') as infile:
+        if getfdccsid(infile.fileno()) & 0xFFFF != 1047:
+            return False
+        with open(output_path, 'wb') as outfile:
+            size = os.fstat(infile.fileno()).st_size
+            sendfile = getattr(os, 'sendfile', None)
+            offset = 0
+            if sendfile is not None:
+                try:
+                    while offset < size:
+                        sent = sendfile(outfile.fileno(), infile.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError:
+                    # Not supported for these files: copy the rest in user space
+                    pass
+            import shutil
+            infile.seek(offset)
+            shutil.copyfileobj(infile, outfile, COPY_BUFFER_SIZE)
+            tag_temp_file(outfile)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _getfdccsid() -> Callable[[int], int] | None:
+    """
+    Look up the z/OS C runtime __getfdccsid() function.
+
+    Returns:
+        The function, or None if it is not available (e.g. not on z/OS)
+    """
+    try:
+        import ctypes
+        func = getattr(ctypes.CDLL(None), '__getfdccsid')
+    except (ImportError, OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int]
+    func.restype = ctypes.c_int
+    return func
+
+
+@functools.lru_cache(maxsize=None)
+def _chgfdccsid() -> Callable[[int, int], int] | None:
+    """
+    Look up the z/OS C runtime __chgfdccsid() function.
+
+    Returns:
+        The function, or None if it is not available (e.g. not on z/OS)
+    """
+    try:
+        import ctypes
+        func = getattr(ctypes.CDLL(None), '__chgfdccsid')
+    except (ImportError, OSError, AttributeError):
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_ushort]
+    func.restype = ctypes.c_int
+    return func
+
+
+def tag_temp_file(temp_file: IO, ccsid: int = 1047, codeset: str = 'IBM-1047') -> None:
+    """
+    Tag an open temporary file with a CCSID (IBM-1047 by default).
+
+    The tag is set on the open descriptor with __chgfdccsid(), avoiding a
+    chtag child process; if that is unavailable chtag is run instead.
+
+    Args:
+        temp_file: Open temporary file object (e.g. from _scratch_file())
+        ccsid: CCSID to tag the file with
+        codeset: Name of the same code set, for the chtag fallback
+    """
+    tag_temp_files((temp_file,), ccsid, codeset)
+
+
+def tag_temp_files(temp_files: Iterable[IO], ccsid: int = 1047, codeset: str = 'IBM-1047',
+                   verbose: bool = False) -> None:
+    """
+    Tag several open temporary files with a CCSID (IBM-1047 by default).
+
+    Each file is tagged on its open descriptor with __chgfdccsid(); any that
+    cannot be tagged that way are passed to a single chtag process.
+
+    Args:
+        temp_files: Open temporary file objects
+        ccsid: CCSID to tag the files with
+        codeset: Name of the same code set, for the chtag fallback
+        verbose: Report files that chtag could not tag
+    """
+    chgfdccsid = _chgfdccsid()
+    untagged = [temp_file.name for temp_file in temp_files
+                if chgfdccsid is None or chgfdccsid(temp_file.fileno(), ccsid) != 0]
+    if untagged:
+        chtag(codeset, *untagged, verbose=verbose)
+
+
+def chtag(codeset: str, *paths: str, verbose: bool = False) -> bool:
+    """
+    Tag one or more files as text in a code set with a single chtag process.
+
+    chtag is run directly, not through a shell, so file names are passed
+    through unchanged. Tagging is best effort: a missing chtag command or a
+    failing chtag is reported in verbose mode but never raised.
+
+    Args:
+        codeset: Code set name (e.g. 'IBM-1047')
+        paths: Files to tag
+        verbose: Report a chtag failure
+
+    Returns:
+        True if chtag tagged the files, False otherwise
+    """
+    import subprocess
+    try:
+        result = subprocess.run(['chtag', '-tc', codeset, *paths], check=False)
+    except OSError as e:
+        if verbose:
+            print(f"Warning: Could not run chtag to tag {' '.join(paths)}: {e}", file=sys.stderr)
+        return False
+    if result.returncode != 0:
+        if verbose:
+            print(f"Warning: chtag failed with return code {result.returncode} "
+                  f"tagging {' '.join(paths)}", file=sys.stderr)
+        return False
+    return True
+
+
 def pad_sysin_to_80_bytes(input_path: str, output_path: str, verbose: bool = False) -> bool:
     """
     Pad each line in SYSIN file to exactly 80 bytes.
@@ -97,21 +425,15 @@ def pad_sysin_to_80_bytes(input_path: str, output_path: str, verbose: bool = Fal
         True if successful, False otherwise
     """
     try:
-        with open(input_path, 'r', encoding='utf-8', errors='replace') as infile:
-            with open(output_path, 'w', encoding='utf-8') as outfile:
-                for line_num, line in enumerate(infile, 1):
-                    # Remove any trailing newline/whitespace
-                    line = line.rstrip('\r\n')
-                    
-                    # Truncate if longer than 80 bytes
-                    if len(line) > 80:
-                        if verbose:
-                            print(f"Warning: Line {line_num} truncated from {len(line)} to 80 bytes")
-                        line = line[:80]
-                    
-                    # Pad to exactly 80 bytes
-                    padded_line = line.ljust(80)
-                    outfile.write(padded_line + '\n')
+        with open(input_path, 'rb') as infile:
+            data = infile.read()
+        
+        with open(output_path, 'wb') as outfile:
+            outfile.write(_pad_records(data, verbose))
+            # Tag ASCII/UTF-8 input so the conversion does not have to guess;
+            # anything else (e.g. EBCDIC) is left for convert_to_ebcdic to detect
+            if _is_utf8(data):
+                tag_temp_file(outfile, 1208, 'UTF-8')
         
         if verbose:
             print(f"Padded SYSIN file to 80-byte records: {output_path}")
@@ -123,6 +445,319 @@ def pad_sysin_to_80_bytes(input_path: str, output_path: str, verbose: bool = Fal
         return False
 
 
+def _pad_records(data: bytes, verbose: bool) -> bytes:
+    """
+    Truncate or pad each line of data to exactly 80 bytes.
+
+    Args:
+        data: Input lines separated by LF, CR or CRLF
+        verbose: Report lines that are truncated
+
+    Returns:
+        The padded lines, each terminated by LF
+    """
+    lines = data.splitlines()
+    
+    if verbose:
+        for line_num, line in enumerate(lines, 1):
+            if len(line) > 80:
+                print(f"Warning: Line {line_num} truncated from {len(line)} to 80 bytes")
+    
+    if not lines:
+        return b''
+    return b'\n'.join([line[:80].ljust(80) for line in lines]) + b'\n'
+
+
+def _is_utf8(data: bytes) -> bool:
+    """Return True if data is ASCII or valid UTF-8"""
+    if data.isascii():
+        return True
+    try:
+        data.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _ascii_to_ibm1047() -> bytes:
+    """
+    Build the bytes.translate() table converting ASCII to IBM-1047.
+
+    Line feed maps to the EBCDIC new line (0x15) that ends each record in a
+    z/OS text file.
+
+    Returns:
+        256-byte translation table
+    """
+    table = bytearray(bytes(range(256)).decode('latin-1').encode('ibm1047'))
+    table[0x0A] = 0x15
+    return bytes(table)
+
+
+@functools.lru_cache(maxsize=None)
+def _ibm1047_to_latin1() -> bytes:
+    """
+    Build the bytes.translate() table converting IBM-1047 to ISO8859-1.
+
+    The EBCDIC new line (0x15) that ends each record maps to line feed.
+
+    Returns:
+        256-byte translation table
+    """
+    table = bytearray(bytes(range(256)).decode('ibm1047').encode('latin-1'))
+    table[0x15] = 0x0A
+    return bytes(table)
+
+
+def copy_ebcdic_to_stdout(path: str) -> None:
+    """
+    Copy an IBM-1047 file to stdout in fixed-size chunks, in constant memory.
+    
+    Each chunk is converted with bytes.translate() and, when it is plain
+    ASCII, written to the binary stdout buffer without building a str.
+    Other chunks, or a stdout with no binary buffer (e.g. a StringIO), are
+    written as text.
+    
+    Args:
+        path: Path to the IBM-1047 file
+    """
+    table = _ibm1047_to_latin1()
+    stdout = sys.stdout
+    buffer = getattr(stdout, 'buffer', None)
+    
+    # Keep anything already printed ahead of the bytes written below
+    stdout.flush()
+    
+    # Unbuffered: each read() is a single read of the file straight into the
+    # chunk, with no intermediate buffer copy
+    with open(path, 'rb', buffering=0) as f:
+        while chunk := f.read(65536):
+            chunk = chunk.translate(table)
+            if buffer is not None and chunk.isascii():
+                buffer.write(chunk)
+            else:
+                stdout.write(chunk.decode('latin-1'))
+                stdout.flush()
+
+
+def encode_ebcdic(text: str) -> bytes:
+    """
+    Encode text as IBM-1047, with each line feed as an EBCDIC new line (0x15).
+    
+    Args:
+        text: Text to encode
+    
+    Returns:
+        The encoded text
+    """
+    if text.isascii():
+        return text.encode('ascii').translate(_ascii_to_ibm1047())
+    return _encode_lines_ibm1047(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _ibm1047_encoder() -> Callable[..., tuple[bytes, int]]:
+    """Return the IBM-1047 encoder, looked up once (the codec exists only on z/OS)"""
+    return codecs.getencoder('ibm1047')
+
+
+def _encode_lines_ibm1047(text: str) -> bytes:
+    """
+    Encode text as IBM-1047 in a single encoder call, then turn each line
+    feed (0x25) into an EBCDIC new line (0x15). Only a line feed encodes to
+    0x25, so no other character is affected.
+    """
+    return _ibm1047_encoder()(text, 'replace')[0].replace(b'\x25', b'\x15')
+
+
+def _pad_text_ebcdic(text: str, verbose: bool) -> bytes:
+    """
+    Truncate or pad each line of text to exactly 80 characters and encode it
+    as IBM-1047 records, for text that is not plain ASCII.
+
+    Args:
+        text: Input lines
+        verbose: Report lines that are truncated
+
+    Returns:
+        The padded records, each terminated by an EBCDIC new line
+    """
+    lines = text.splitlines()
+    
+    if verbose:
+        for line_num, line in enumerate(lines, 1):
+            if len(line) > 80:
+                print(f"Warning: Line {line_num} truncated from {len(line)} to 80 bytes")
+    
+    if not lines:
+        return b''
+    return _encode_lines_ibm1047('\n'.join([line[:80].ljust(80) for line in lines]) + '\n')
+
+
+def _write_sysin_ebcdic(records: bytes, output: str | IO[bytes], verbose: bool) -> bool:
+    """Write prepared IBM-1047 SYSIN records to output, tagged IBM-1047"""
+    if isinstance(output, str):
+        with open(output, 'wb') as outfile:
+            outfile.write(records)
+            tag_temp_file(outfile)
+    else:
+        output.write(records)
+        tag_temp_file(output)
+    
+    if verbose:
+        print(f"Prepared SYSIN as 80-byte EBCDIC records: {_output_name(output)}")
+    
+    return True
+
+
+def _output_name(output: str | IO[bytes]) -> str:
+    """Return the path of an output given as a path or an open file"""
+    return output if isinstance(output, str) else output.name
+
+
+def prepare_sysin_ebcdic(input_path: str, output: str | IO[bytes], verbose: bool = False) -> bool:
+    """
+    Pad each line in a SYSIN file to exactly 80 bytes and convert it to
+    IBM-1047 in a single pass.
+    
+    ASCII and UTF-8 input is converted directly, without encoding detection.
+    Anything else (e.g. a file that is already EBCDIC) is padded and then
+    passed to convert_to_ebcdic() to detect its encoding.
+    
+    Args:
+        input_path: Source SYSIN file path
+        output: Destination EBCDIC file path, or a binary file already open
+            for writing (e.g. a work file), which is written in place
+        verbose: Enable verbose output
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        with open(input_path, 'rb') as infile:
+            data = infile.read()
+        
+        if data.isascii():
+            return _write_sysin_ebcdic(_pad_records(data, verbose).translate(_ascii_to_ibm1047()),
+                                       output, verbose)
+        
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = None
+        if text is not None:
+            return _write_sysin_ebcdic(_pad_text_ebcdic(text, verbose), output, verbose)
+        
+    except Exception as e:
+        print(f"ERROR: Failed to prepare SYSIN file: {e}", file=sys.stderr)
+        return False
+    
+    # Unknown encoding: pad, then let convert_to_ebcdic detect it
+    temp_padded = _scratch_file('.sysin.padded', buffering=0)
+    temp_padded.close()
+    try:
+        return (pad_sysin_to_80_bytes(input_path, temp_padded.name, verbose)
+                and convert_to_ebcdic(temp_padded.name, _output_name(output), verbose))
+    finally:
+        os.unlink(temp_padded.name)
+
+
+def read_sysin_text(input_path: str, verbose: bool = False) -> str | None:
+    """
+    Read a SYSIN file as text, recognising encodings as prepare_sysin_ebcdic()
+    does.
+    
+    ASCII and UTF-8 input is decoded directly, without encoding detection.
+    Anything else is passed to convert_to_ebcdic() to detect its encoding
+    and then decoded from IBM-1047. Nothing is decoded with replacement.
+    
+    Args:
+        input_path: Source SYSIN file path
+        verbose: Enable verbose output
+    
+    Returns:
+        The file's text, or None if it could not be read or decoded
+    """
+    try:
+        with open(input_path, 'rb') as infile:
+            data = infile.read()
+        
+        if data.isascii():
+            return data.decode('ascii')
+        
+        try:
+            return data.decode('utf-8')
+        except UnicodeDecodeError:
+            pass
+        
+    except Exception as e:
+        print(f"ERROR: Failed to read SYSIN file: {e}", file=sys.stderr)
+        return None
+    
+    # Unknown encoding: let convert_to_ebcdic detect it, then decode the
+    # IBM-1047 result, whose lines end in NL (X'15')
+    temp_ebcdic = _scratch_file('.sysin.ebcdic', buffering=0)
+    temp_ebcdic.close()
+    try:
+        if not convert_to_ebcdic(input_path, temp_ebcdic.name, verbose):
+            return None
+        with open(temp_ebcdic.name, 'rb') as infile:
+            return infile.read().decode('ibm1047').replace('\x85', '\n')
+    except Exception as e:
+        print(f"ERROR: Failed to read SYSIN file: {e}", file=sys.stderr)
+        return None
+    finally:
+        os.unlink(temp_ebcdic.name)
+
+
+def prepare_sysin_content_ebcdic(content: str, output: str | IO[bytes], verbose: bool = False) -> bool:
+    """
+    Write SYSIN content held in a string as 80-byte IBM-1047 records.
+    
+    Args:
+        content: SYSIN content
+        output: Destination EBCDIC file path, or a binary file already open
+            for writing, which is written in place
+        verbose: Enable verbose output
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        # Verbose runs report truncated lines, so they always pad afresh
+        if verbose or len(content) > SYSIN_CACHE_LIMIT:
+            records = _sysin_records(content, verbose)
+        else:
+            records = _cached_sysin_records(content)
+        return _write_sysin_ebcdic(records, output, verbose)
+        
+    except Exception as e:
+        print(f"ERROR: Failed to prepare SYSIN content: {e}", file=sys.stderr)
+        return False
+
+
+# Longest SYSIN content whose records are cached, so that large content is
+# not kept in memory after the call
+SYSIN_CACHE_LIMIT = 64 * 1024
+
+
+def _sysin_records(content: str, verbose: bool) -> bytes:
+    """Pad SYSIN content to 80-byte records and encode it as IBM-1047"""
+    if content.isascii():
+        return _pad_records(content.encode('ascii'), verbose).translate(_ascii_to_ibm1047())
+    return _pad_text_ebcdic(content, verbose)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_sysin_records(content: str) -> bytes:
+    """
+    Return the SYSIN records for content, reusing them when the same SYSIN is
+    sent again (e.g. a statement run in a loop)
+    """
+    return _sysin_records(content, False)
+
+
 def validate_input_file(path: str, name: str) -> bool:
     """Validate that input file exists and is readable"""
     if not os.path.exists(path):
@@ -136,70 +771,87 @@ def validate_input_file(path: str, name: str) -> bool:
     return True
 
 
-def tsocmd(systsin_file: str, sysin_file: str,
+def tsocmd(systsin_file: str, sysin_file: str | None,
                        systsprt_file: str = 'stdout',
                        sysprint_file: str = 'stdout',
-                       steplib: str | list[str] | None = None,
-                       dbrmlib: str | list[str] | None = None,
+                       steplib: str | Iterable[str] | None = None,
+                       dbrmlib: str | Iterable[str] | None = None,
                        library: str | None = None,
                        debug: bool = False,
-                       verbose: bool = False) -> int:
+                       verbose: bool = False,
+                       sysin_content: str | None = None,
+                       systsin_encoding: str | None = None) -> int:
     """
     Execute TSO command using IKJEFT1B with SYSTSIN and SYSIN inputs
     
     Args:
         systsin_file: Path to SYSTSIN input file
-        sysin_file: Path to SYSIN input file
+        sysin_file: Path to SYSIN input file (None when sysin_content is given)
         systsprt_file: Path to SYSTSPRT output file or 'stdout' (defaults to 'stdout')
         sysprint_file: Path to SYSPRINT output file or 'stdout' (defaults to 'stdout')
-        steplib: Optional STEPLIB dataset name(s) - single string or list of strings for concatenation
-        dbrmlib: Optional DBRMLIB dataset name(s) - single string or list of strings for concatenation
+        steplib: Optional STEPLIB dataset name(s) - single string or iterable of strings for concatenation
+        dbrmlib: Optional DBRMLIB dataset name(s) - single string or iterable of strings for concatenation
         library: Optional USS filesystem directory for DBRMs (mutually exclusive with dbrmlib)
         debug: Preserve temporary files for debugging (do not delete)
         verbose: Enable verbose output
+        sysin_content: SYSIN input as a string, padded straight into the SYSIN
+            work file instead of first being written to a file of its own
+            (mutually exclusive with sysin_file)
+        systsin_encoding: Encoding of systsin_file if known (e.g. 'ascii'),
+            or None to detect it. 'IBM-1047' uses the file as-is, unconverted
     
     Returns:
         Return code from IKJEFT1B execution
     """
     
+    # Validate that exactly one of sysin_file or sysin_content is provided
+    if (sysin_file is None) == (sysin_content is None):
+        print("ERROR: Must specify exactly one of sysin_file or sysin_content", file=sys.stderr)
+        return 8
+    
     # Validate input files
     if not validate_input_file(systsin_file, "SYSTSIN"):
         return 8
     
-    if not validate_input_file(sysin_file, "SYSIN"):
+    if sysin_file is not None and not validate_input_file(sysin_file, "SYSIN"):
         return 8
     
     if verbose:
         print(f"SYSTSIN: {systsin_file}")
-        print(f"SYSIN: {sysin_file}")
+        print(f"SYSIN: {sysin_file if sysin_file is not None else 'content string'}")
     
     # Create temporary files for EBCDIC conversion
     temp_systsin = None
     temp_sysin = None
-    temp_sysin_padded = None
     temp_systsprt = None
     temp_sysprint = None
     
     try:
-        # Convert SYSTSIN to EBCDIC
-        temp_systsin = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.systsin')
-        temp_systsin.close()
-        
-        if not convert_to_ebcdic(systsin_file, temp_systsin.name, verbose):
-            return 8
+        # Convert SYSTSIN to EBCDIC unless it already is
+        if systsin_encoding == 'IBM-1047':
+            systsin_path = systsin_file
+        else:
+            temp_systsin = _scratch_file('.systsin', buffering=0)
+            temp_systsin.close()
+            systsin_path = temp_systsin.name
+            
+            if not convert_to_ebcdic(systsin_file, systsin_path, verbose, systsin_encoding):
+                return 8
         
-        # Pad SYSIN to 80 bytes per line, then convert to EBCDIC
-        temp_sysin_padded = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin.padded')
-        temp_sysin_padded.close()
+        # Pad SYSIN to 80 bytes per line and convert to EBCDIC in one pass
+        # straight into the still-open work file
+        temp_sysin = _scratch_file('.sysin')
+        with temp_sysin:
+            if sysin_file is not None:
+                prepared = prepare_sysin_ebcdic(sysin_file, temp_sysin, verbose)
+            else:
+                prepared = prepare_sysin_content_ebcdic(sysin_content, temp_sysin, verbose)  # type: ignore
         
-        if not pad_sysin_to_80_bytes(sysin_file, temp_sysin_padded.name, verbose):
+        if not prepared:
             return 8
         
-        temp_sysin = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.sysin')
-        temp_sysin.close()
-        
-        if not convert_to_ebcdic(temp_sysin_padded.name, temp_sysin.name, verbose):
-            return 8
+        from zoautil_py import mvscmd
+        from zoautil_py.ztypes import DDStatement, FileDefinition, DatasetDefinition
         
         # Define DD statements for IKJEFT1B
         dds = []
@@ -207,7 +859,7 @@ def tsocmd(systsin_file: str, sysin_file: str,
         # Add STEPLIB if specified (supports concatenation)
         if steplib:
             # Convert single string to list for uniform processing
-            steplib_list = [steplib] if isinstance(steplib, str) else steplib
+            steplib_list = [steplib] if isinstance(steplib, str) else list(steplib)
             # Create concatenated dataset definition
             steplib_defs = [DatasetDefinition(ds) for ds in steplib_list]
             dds.append(DDStatement('STEPLIB', steplib_defs))
@@ -218,7 +870,7 @@ def tsocmd(systsin_file: str, sysin_file: str,
         # Note: DBRMLIB is NOT used when library parameter is specified
         if dbrmlib and not library:
             # Convert single string to list for uniform processing
-            dbrmlib_list = [dbrmlib] if isinstance(dbrmlib, str) else dbrmlib
+            dbrmlib_list = [dbrmlib] if isinstance(dbrmlib, str) else list(dbrmlib)
             # Create concatenated dataset definition
             dbrmlib_defs = [DatasetDefinition(ds) for ds in dbrmlib_list]
             dds.append(DDStatement('DBRMLIB', dbrmlib_defs))
@@ -229,9 +881,7 @@ def tsocmd(systsin_file: str, sysin_file: str,
         if systsprt_file == 'stdout':
             # Create a temporary file for SYSTSPRT output
             # We'll read this and write to stdout after execution
-            temp_systsprt = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.systsprt')
-            temp_systsprt.close()
-            os.system(f"chtag -tc IBM-1047 {temp_systsprt.name}")
+            temp_systsprt = _scratch_file('.systsprt', buffering=0)
             dds.append(DDStatement('SYSTSPRT', FileDefinition(f"{temp_systsprt.name},recfm=FB")))
             if verbose:
                 print(f"SYSTSPRT: temporary file (will copy to stdout)")
@@ -241,15 +891,13 @@ def tsocmd(systsin_file: str, sysin_file: str,
                 print(f"SYSTSPRT: {systsprt_file}")
         
         # Add SYSTSIN
-        dds.append(DDStatement('SYSTSIN', FileDefinition(f"{temp_systsin.name},lrecl=80,recfm=FB")))
+        dds.append(DDStatement('SYSTSIN', FileDefinition(f"{systsin_path},lrecl=80,recfm=FB")))
         
         # Add SYSPRINT - use temp file if stdout, otherwise use specified file
         if sysprint_file == 'stdout':
             # Create a temporary file for SYSPRINT output
             # We'll read this and write to stdout after execution
-            temp_sysprint = tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.sysprint')
-            temp_sysprint.close()
-            os.system(f"chtag -tc IBM-1047 {temp_sysprint.name}")
+            temp_sysprint = _scratch_file('.sysprint', buffering=0)
             dds.append(DDStatement('SYSPRINT', FileDefinition(f"{temp_sysprint.name},recfm=FB")))
             if verbose:
                 print(f"SYSPRINT: temporary file (will copy to stdout)")
@@ -258,6 +906,14 @@ def tsocmd(systsin_file: str, sysin_file: str,
             if verbose:
                 print(f"SYSPRINT: {sysprint_file}")
         
+        # Tag the stdout capture files together, so that at most one chtag
+        # process is needed for both
+        capture_files = [f for f in (temp_systsprt, temp_sysprint) if f]
+        if capture_files:
+            tag_temp_files(capture_files, verbose=verbose)
+            for capture_file in capture_files:
+                capture_file.close()
+        
         # Add remaining DD statements
         dds.extend([
             DDStatement('SYSUDUMP', FileDefinition('DUMMY')),
@@ -290,46 +946,36 @@ def tsocmd(systsin_file: str, sysin_file: str,
         # 1. SYSTSPRT output (if stdout was requested)
         if systsprt_file == 'stdout' and temp_systsprt:
             try:
-                with open(temp_systsprt.name, 'r', encoding='ibm1047') as f:
-                    content = f.read()
-                    if content:  # Only print if there's content
-                        print(content, end='')
+                copy_ebcdic_to_stdout(temp_systsprt.name)
             except Exception as e:
                 if verbose:
                     print(f"Warning: Could not read SYSTSPRT output: {e}", file=sys.stderr)
             finally:
                 # Only delete if not in debug mode
-                if not debug and os.path.exists(temp_systsprt.name):
-                    os.unlink(temp_systsprt.name)
+                if not debug:
+                    _remove_work_file(temp_systsprt)
         
         # 2. SYSPRINT output (if stdout was requested)
         if sysprint_file == 'stdout' and temp_sysprint:
             try:
-                with open(temp_sysprint.name, 'r', encoding='ibm1047') as f:
-                    content = f.read()
-                    if content:  # Only print if there's content
-                        print(content, end='')
+                copy_ebcdic_to_stdout(temp_sysprint.name)
             except Exception as e:
                 if verbose:
                     print(f"Warning: Could not read SYSPRINT output: {e}", file=sys.stderr)
             finally:
                 # Only delete if not in debug mode
-                if not debug and os.path.exists(temp_sysprint.name):
-                    os.unlink(temp_sysprint.name)
+                if not debug:
+                    _remove_work_file(temp_sysprint)
         
         if verbose or response.rc != 0:
             print(f"\nReturn code: {response.rc}")
         
         # Tag output files as IBM-1047 (only for actual files, not stdout)
-        if systsprt_file != 'stdout':
-            os.system(f"chtag -tc IBM-1047 {systsprt_file}")
-            if verbose:
-                print(f"Tagged {systsprt_file} as IBM-1047")
-        
-        if sysprint_file != 'stdout':
-            os.system(f"chtag -tc IBM-1047 {sysprint_file}")
-            if verbose:
-                print(f"Tagged {sysprint_file} as IBM-1047")
+        output_files = [path for path in dict.fromkeys((systsprt_file, sysprint_file)) if path != 'stdout']
+        # Tagging is best effort: a failure never changes the return code
+        if output_files and chtag('IBM-1047', *output_files, verbose=verbose) and verbose:
+            for path in output_files:
+                print(f"Tagged {path} as IBM-1047")
         
         return response.rc
         
@@ -338,28 +984,26 @@ def tsocmd(systsin_file: str, sysin_file: str,
         return 16
         
     finally:
+        # The capture files are normally closed once tagged; an exception
+        # before that leaves them open (closing a closed file does nothing)
+        for capture_file in (temp_systsprt, temp_sysprint):
+            if capture_file is not None:
+                capture_file.close()
+        
         # Clean up temporary files unless debug mode is enabled
         if not debug:
-            if temp_systsin and os.path.exists(temp_systsin.name):
-                os.unlink(temp_systsin.name)
-            if temp_sysin_padded and os.path.exists(temp_sysin_padded.name):
-                os.unlink(temp_sysin_padded.name)
-            if temp_sysin and os.path.exists(temp_sysin.name):
-                os.unlink(temp_sysin.name)
+            _remove_work_file(temp_systsin)
+            _remove_work_file(temp_sysin)
             # Note: temp_systsprt and temp_sysprint are cleaned up in the main try block
             # after reading their contents, but we check here in case of early exit
-            if temp_systsprt and os.path.exists(temp_systsprt.name):
-                os.unlink(temp_systsprt.name)
-            if temp_sysprint and os.path.exists(temp_sysprint.name):
-                os.unlink(temp_sysprint.name)
+            _remove_work_file(temp_systsprt)
+            _remove_work_file(temp_sysprint)
         else:
             # In debug mode, print locations of preserved files
             if verbose:
                 print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
                 if temp_systsin and os.path.exists(temp_systsin.name):
                     print(f"SYSTSIN: {temp_systsin.name}", file=sys.stderr)
-                if temp_sysin_padded and os.path.exists(temp_sysin_padded.name):
-                    print(f"SYSIN (padded): {temp_sysin_padded.name}", file=sys.stderr)
                 if temp_sysin and os.path.exists(temp_sysin.name):
                     print(f"SYSIN (EBCDIC): {temp_sysin.name}", file=sys.stderr)
                 if temp_systsprt and os.path.exists(temp_systsprt.name):
@@ -368,17 +1012,79 @@ def tsocmd(systsin_file: str, sysin_file: str,
                     print(f"SYSPRINT: {temp_sysprint.name}", file=sys.stderr)
 
 
+def _join_sysin_blocks(sysin_content: str | Iterable[str] | None, terminator: str = '') -> str | None:
+    """
+    Join a list of SYSIN blocks into the SYSIN content for one IKJEFT1B run.
+
+    A string (or None) is returned unchanged. Otherwise blank blocks are
+    skipped, each block has its trailing whitespace removed and terminator
+    appended if it does not already end with it, and the blocks are joined
+    one after the other on new lines. A block whose last line ends in a '--'
+    comment gets the terminator on a line of its own, outside the comment.
+
+    Args:
+        sysin_content: SYSIN content as a string, or an iterable of blocks
+        terminator: Statement terminator each block must end with (e.g. ';')
+
+    Returns:
+        The SYSIN content as a single string, or None if sysin_content is
+        None or holds no non-blank blocks
+    """
+    if sysin_content is None or isinstance(sysin_content, str):
+        return sysin_content
+
+    blocks = []
+    for block in sysin_content:
+        block = block.rstrip()
+        if not block:
+            continue
+        if terminator:
+            comment = _line_comment_start(block)
+            code = block if comment < 0 else block[:comment].rstrip()
+            if not code.endswith(terminator):
+                block += terminator if comment < 0 else f"\n{terminator}"
+        blocks.append(block)
+    if not blocks:
+        return None
+    return ''.join(f"{block}\n" for block in blocks)
+
+
+def _line_comment_start(text: str) -> int:
+    """
+    Find a '--' comment on the last line of some SQL.
+
+    Args:
+        text: SQL text
+
+    Returns:
+        Index in text of the '--' outside quotes on its last line, or -1
+    """
+    start = text.rfind('\n') + 1
+    quote = None
+    for i in range(start, len(text)):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char == "'" or char == '"':
+            quote = char
+        elif text.startswith('--', i):
+            return i
+    return -1
+
+
 def db2sql(
-    sysin_content: str | None = None,
+    sysin_content: str | Iterable[str] | None = None,
     sysin_file: str | None = None,
     system: str | None = None,
     plan: str = 'DSNTEP2',
     toollib: str | None = None,
-    steplib: str | list[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     debug: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    dbrmlib: str | Iterable[str] | None = None
 ) -> int:
     """
     Execute SQL statements (DDL, DML, DQL, GRANT) using DSNTEP2 via IKJEFT1B.
@@ -386,17 +1092,23 @@ def db2sql(
     Covers: SELECT, INSERT, UPDATE, DELETE, CREATE/DROP DATABASE/TABLE/TABLESPACE/
     STOGROUP/INDEX, GRANT, REVOKE, SET CURRENT SQLID, and any other dynamic SQL.
 
+    A list of SQL blocks is run in a single DSNTEP2 invocation, so the
+    IKJEFT1B start-up and plan allocation are paid once for all of them. A
+    block that does not end with a semicolon has one added.
+
     Args:
-        sysin_content: SQL statements as a string (mutually exclusive with sysin_file)
+        sysin_content: SQL statements as a string, or a list of SQL blocks
+            (mutually exclusive with sysin_file)
         sysin_file: Path to file containing SQL statements (mutually exclusive with sysin_content)
         system: Db2 subsystem ID (required)
         plan: Db2 plan name for DSNTEP2 (defaults to 'DSNTEP2')
         toollib: Db2 tool library containing DSNTEP2 (required)
-        steplib: Optional STEPLIB dataset name(s) - single string or list for concatenation
+        steplib: Optional STEPLIB dataset name(s) - single string or iterable for concatenation
         systsprt_file: Path to SYSTSPRT output file or 'stdout' (defaults to 'stdout')
         sysprint_file: Path to SYSPRINT output file or 'stdout' (defaults to 'stdout')
         debug: Preserve temporary files for debugging (do not delete)
         verbose: Enable verbose output
+        dbrmlib: Optional DBRMLIB dataset name(s) - single string or iterable for concatenation
 
     Returns:
         Return code from IKJEFT1B execution
@@ -420,9 +1132,14 @@ def db2sql(
         print("ERROR: toollib parameter is required", file=sys.stderr)
         return 8
 
+    if sysin_content is not None:
+        sysin_content = _join_sysin_blocks(sysin_content, ';')
+        if sysin_content is None:
+            print("ERROR: No SQL statements provided", file=sys.stderr)
+            return 8
+
     # Create temporary files
-    temp_systsin = None
-    temp_sysin = None
+    systsin_path = None
 
     try:
         # Generate SYSTSIN content: DSN → RUN PROGRAM(DSNTEP2)
@@ -436,32 +1153,27 @@ def db2sql(
             print(f"Generated SYSTSIN content:")
             print(systsin_content)
 
-        # Create temporary SYSTSIN file
-        temp_systsin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.systsin')
-        temp_systsin.write(systsin_content)
-        temp_systsin.close()
-
-        # Handle SYSIN input
-        if sysin_content is not None:
-            temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-            temp_sysin.write(sysin_content)
-            temp_sysin.close()
-            sysin_path = temp_sysin.name
-        else:
-            sysin_path = sysin_file  # type: ignore
+        # SYSTSIN work file, already in EBCDIC; shared by every call that
+        # generates the same SYSTSIN
+        systsin_path = _systsin_work_file(systsin_content, debug)
 
+        # SYSIN content is passed to tsocmd as a string and padded straight
+        # into the SYSIN work file, with no intermediate file
         if verbose:
             print(f"SYSIN source: {'content string' if sysin_content else sysin_file}")
 
         # Execute via tsocmd
         rc = tsocmd(
-            systsin_file=temp_systsin.name,
-            sysin_file=sysin_path,  # type: ignore
+            systsin_file=systsin_path,
+            sysin_file=sysin_file,
             systsprt_file=systsprt_file,
             sysprint_file=sysprint_file,
             steplib=steplib,
+            dbrmlib=dbrmlib,
             debug=debug,
-            verbose=verbose
+            verbose=verbose,
+            sysin_content=sysin_content,
+            systsin_encoding='IBM-1047'
         )
         
         return rc
@@ -471,29 +1183,38 @@ def db2sql(
         return 16
         
     finally:
-        # Clean up temporary files unless debug mode is enabled
-        if not debug:
-            if temp_systsin and os.path.exists(temp_systsin.name):
-                os.unlink(temp_systsin.name)
-            if temp_sysin and os.path.exists(temp_sysin.name):
-                os.unlink(temp_sysin.name)
-        else:
-            # In debug mode, print locations of preserved files
-            if verbose:
-                print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
-                if temp_systsin and os.path.exists(temp_systsin.name):
-                    print(f"SYSTSIN: {temp_systsin.name}", file=sys.stderr)
-                if temp_sysin and os.path.exists(temp_sysin.name):
-                    print(f"SYSIN: {temp_sysin.name}", file=sys.stderr)
+        # The SYSTSIN work file is kept: for reuse (it is removed at exit),
+        # or in debug mode for inspection, when its location is printed
+        if debug and verbose:
+            print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
+            if systsin_path:
+                print(f"SYSTSIN: {systsin_path}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=None)
+def _op_prefix_re() -> 're.Pattern[str]':
+    """
+    Compile the pattern db2op() uses to add the '-' operator command prefix.
+
+    It matches the leading blanks of each line that is not blank and does
+    not start with '-' after them, in text whose lines end in a newline
+    alone; db2op() replaces them with '-'.
+
+    Returns:
+        Compiled pattern
+    """
+    # Imported here so that only db2op() pays for it
+    import re
+    return re.compile(r'^[^\S\n]*(?=[^\s-])', re.MULTILINE)
 
 
 def db2op(
-    sysin_content: str | None = None,
+    sysin_content: str | Iterable[str] | None = None,
     sysin_file: str | None = None,
     system: str | None = None,
     plan: str | None = None,
     toollib: str | None = None,
-    steplib: str | list[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     debug: bool = False,
@@ -505,13 +1226,17 @@ def db2op(
     The SYSIN input should contain Db2 operator commands, one per line, with or without
     the leading '-' prefix (it will be normalised automatically).
 
+    A list of command blocks is run in a single DSNTIAD invocation, one block
+    after another, so the IKJEFT1B start-up is paid once for all of them.
+
     Args:
-        sysin_content: Db2 operator commands as a string (mutually exclusive with sysin_file)
+        sysin_content: Db2 operator commands as a string, or a list of command
+            blocks (mutually exclusive with sysin_file)
         sysin_file: Path to file containing Db2 operator commands (mutually exclusive with sysin_content)
         system: Db2 subsystem ID (required)
         plan: Db2 plan name for DSNTIAD (required)
         toollib: Db2 tool library containing DSNTIAD (required)
-        steplib: Optional STEPLIB dataset name(s) - single string or list for concatenation
+        steplib: Optional STEPLIB dataset name(s) - single string or iterable for concatenation
         systsprt_file: Path to SYSTSPRT output file or 'stdout' (defaults to 'stdout')
         sysprint_file: Path to SYSPRINT output file or 'stdout' (defaults to 'stdout')
         debug: Preserve temporary files for debugging (do not delete)
@@ -543,9 +1268,14 @@ def db2op(
         print("ERROR: toollib parameter is required", file=sys.stderr)
         return 8
 
+    if sysin_content is not None:
+        sysin_content = _join_sysin_blocks(sysin_content)
+        if sysin_content is None:
+            print("ERROR: No operator commands provided", file=sys.stderr)
+            return 8
+
     # Create temporary files
-    temp_systsin = None
-    temp_sysin = None
+    systsin_path = None
 
     try:
         # Generate SYSTSIN content: DSN → RUN PROGRAM(DSNTIAD)
@@ -559,41 +1289,34 @@ def db2op(
             print(f"Generated SYSTSIN content:")
             print(systsin_content)
 
-        # Create temporary SYSTSIN file
-        temp_systsin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.systsin')
-        temp_systsin.write(systsin_content)
-        temp_systsin.close()
+        # SYSTSIN work file, already in EBCDIC; shared by every call that
+        # generates the same SYSTSIN
+        systsin_path = _systsin_work_file(systsin_content, debug)
 
         # Handle SYSIN input - normalise operator command prefix
         if sysin_content is not None:
-            # Ensure each non-blank line starts with '-'
-            normalised_lines = []
-            for line in sysin_content.splitlines():
-                stripped = line.strip()
-                if stripped and not stripped.startswith('-'):
-                    normalised_lines.append('-' + line.lstrip())
-                else:
-                    normalised_lines.append(line)
-            normalised_content = '\n'.join(normalised_lines) + '\n'
-            temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-            temp_sysin.write(normalised_content)
-            temp_sysin.close()
-            sysin_path = temp_sysin.name
+            # Passed to tsocmd as a string: it is padded straight into the
+            # SYSIN work file, with no intermediate file
+            # splitlines() first, so that every line ending the padding
+            # recognises (e.g. '\r') also starts a command here
+            normalised_content = _op_prefix_re().sub('-', '\n'.join(sysin_content.splitlines())) + '\n'
         else:
-            sysin_path = sysin_file  # type: ignore
+            normalised_content = None
 
         if verbose:
             print(f"SYSIN source: {'content string' if sysin_content else sysin_file}")
 
         # Execute via tsocmd
         rc = tsocmd(
-            systsin_file=temp_systsin.name,
-            sysin_file=sysin_path,  # type: ignore
+            systsin_file=systsin_path,
+            sysin_file=sysin_file,
             systsprt_file=systsprt_file,
             sysprint_file=sysprint_file,
             steplib=steplib,
             debug=debug,
-            verbose=verbose
+            verbose=verbose,
+            sysin_content=normalised_content,
+            systsin_encoding='IBM-1047'
         )
         
         return rc
@@ -603,35 +1326,48 @@ def db2op(
         return 16
         
     finally:
-        # Clean up temporary files unless debug mode is enabled
-        if not debug:
-            if temp_systsin and os.path.exists(temp_systsin.name):
-                os.unlink(temp_systsin.name)
-            if temp_sysin and os.path.exists(temp_sysin.name):
-                os.unlink(temp_sysin.name)
-        else:
-            # In debug mode, print locations of preserved files
-            if verbose:
-                print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
-                if temp_systsin and os.path.exists(temp_systsin.name):
-                    print(f"SYSTSIN: {temp_systsin.name}", file=sys.stderr)
-                if temp_sysin and os.path.exists(temp_sysin.name):
-                    print(f"SYSIN: {temp_sysin.name}", file=sys.stderr)
+        # The SYSTSIN work file is kept: for reuse (it is removed at exit),
+        # or in debug mode for inspection, when its location is printed
+        if debug and verbose:
+            print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
+            if systsin_path:
+                print(f"SYSTSIN: {systsin_path}", file=sys.stderr)
+
+
+# BIND PACKAGE subcommand for one member, keyed by (OWNER given, USS
+# LIBRARY given). QUALIFIER is only used with OWNER; {qualifier} is either
+# empty or 'QUALIFIER(...) '.
+_BIND_PACKAGE_TEMPLATES = {
+    (True, True): ('  BIND PACKAGE({package}) OWNER({owner}) -\n'
+                   '  {qualifier}-\n'
+                   '  LIBRARY("{library}") -\n'
+                   '  MEMBER("{member}") -\n'
+                   '  ACTION({action})'),
+    (True, False): ('  BIND PACKAGE({package}) OWNER({owner}) -\n'
+                    '  {qualifier}-\n'
+                    '  MEMBER({member}) -\n'
+                    '  ACTION({action})'),
+    (False, True): ('  BIND PACKAGE({package}) LIBRARY("{library}") -\n'
+                    '  MEMBER("{member}") -\n'
+                    '  ACTION({action})'),
+    (False, False): ('  BIND PACKAGE({package}) MEMBER({member}) -\n'
+                     '  ACTION({action})'),
+}
 
 
 def db2bind(
     system: str | None = None,
     package: str | None = None,
     plan: str | None = None,
-    members: str | list[str] | None = None,
+    members: str | Iterable[str] | None = None,
     owner: str | None = None,
     qualifier: str | None = None,
     action: str = 'REPLACE',
     isolation: str | None = None,
-    pklist: str | list[str] | None = None,
-    dbrmlib: str | list[str] | None = None,
+    pklist: str | Iterable[str] | None = None,
+    dbrmlib: str | Iterable[str] | None = None,
     library: str | None = None,
-    steplib: str | list[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     debug: bool = False,
@@ -647,15 +1383,15 @@ def db2bind(
         system: Db2 subsystem ID (required)
         package: Package collection name for BIND PACKAGE (e.g. 'PCBSA')
         plan: Plan name for BIND PLAN (e.g. 'CBSA')
-        members: DBRM member name(s) to bind as packages - single string or list
+        members: DBRM member name(s) to bind as packages - single string or iterable
         owner: OWNER qualifier for BIND subcommands
         qualifier: QUALIFIER for BIND subcommands
         action: BIND action - 'ADD' or 'REPLACE' (default: 'REPLACE')
         isolation: Isolation level for BIND PLAN (e.g. 'UR', 'CS', 'RS', 'RR')
-        pklist: Package list for BIND PLAN PKLIST - single string or list
-        dbrmlib: DBRMLIB dataset name(s) - single string or list for concatenation
+        pklist: Package list for BIND PLAN PKLIST - single string or iterable
+        dbrmlib: DBRMLIB dataset name(s) - single string or iterable for concatenation
         library: USS filesystem directory containing DBRMs (mutually exclusive with dbrmlib)
-        steplib: Optional STEPLIB dataset name(s) - single string or list for concatenation
+        steplib: Optional STEPLIB dataset name(s) - single string or iterable for concatenation
         systsprt_file: Path to SYSTSPRT output file or 'stdout' (defaults to 'stdout')
         sysprint_file: Path to SYSPRINT output file or 'stdout' (defaults to 'stdout')
         verbose: Enable verbose output
@@ -695,60 +1431,36 @@ def db2bind(
     # Build SYSTSIN content
     lines = [f"  DSN SYSTEM({system})"]
 
-    # One BIND PACKAGE per member
+    # One BIND PACKAGE per member, all from the same template
     if package is not None:
+        template = _BIND_PACKAGE_TEMPLATES[bool(owner), bool(library)]
+        fields = {
+            'package': package,
+            'owner': owner,
+            'qualifier': f"QUALIFIER({qualifier}) " if qualifier else "",
+            'library': library,
+            'action': action,
+        }
         for member in members_list:
             # Strip .dbrm extension if present for MEMBER parameter
-            member_name = member[:-5] if member.lower().endswith('.dbrm') else member
-            
-            bind_pkg = f"  BIND PACKAGE({package})"
-            if owner:
-                bind_pkg += f" OWNER({owner}) -"
-                lines.append(bind_pkg)
-                qualifier_line = f"  QUALIFIER({qualifier}) -" if qualifier else "  -"
-                lines.append(qualifier_line)
-                
-                # Add LIBRARY parameter if using filesystem
-                if library:
-                    lines.append(f'  LIBRARY("{library}") -')
-                    lines.append(f'  MEMBER("{member_name}") -')
-                else:
-                    lines.append(f"  MEMBER({member_name}) -")
-            else:
-                # Add LIBRARY parameter if using filesystem
-                if library:
-                    bind_pkg += f' LIBRARY("{library}") -'
-                    lines.append(bind_pkg)
-                    lines.append(f'  MEMBER("{member_name}") -')
-                else:
-                    bind_pkg += f" MEMBER({member_name}) -"
-                    lines.append(bind_pkg)
-            
-            lines.append(f"  ACTION({action})")
+            fields['member'] = member[:-5] if member.lower().endswith('.dbrm') else member
+            lines.append(template.format_map(fields))
             lines.append("")
 
-    # BIND PLAN
+    # BIND PLAN: its options are collected first, so every line but the
+    # last gets the ' -' continuation as the lines are joined
     if plan is not None:
-        bind_plan = f"  BIND PLAN({plan})"
+        plan_lines = [f"  BIND PLAN({plan})"]
         if owner:
-            bind_plan += f" -"
-            lines.append(bind_plan)
-            lines.append(f"   OWNER({owner}) -")
-        else:
-            bind_plan += " -"
-            lines.append(bind_plan)
+            plan_lines.append(f"   OWNER({owner})")
         if isolation:
-            lines.append(f"   ISOLATION({isolation}) -")
+            plan_lines.append(f"   ISOLATION({isolation})")
         if pklist:
             pklist_list = [pklist] if isinstance(pklist, str) else list(pklist)
-            lines.append(f"   PKLIST( -")
-            for i, pkg in enumerate(pklist_list):
-                suffix = " -" if i < len(pklist_list) - 1 else " )"
-                lines.append(f"   {pkg}{suffix}")
-        else:
-            # Remove trailing ' -' from last line if no pklist
-            if lines and lines[-1].endswith(' -'):
-                lines[-1] = lines[-1][:-2]
+            plan_lines.append("   PKLIST(")
+            plan_lines.extend(f"   {pkg}" for pkg in pklist_list)
+            plan_lines[-1] += " )"
+        lines.append(' -\n'.join(plan_lines))
 
     lines.append("  END")
     systsin_content = '\n'.join(lines) + '\n'
@@ -757,31 +1469,27 @@ def db2bind(
         print("Generated SYSTSIN content:")
         print(systsin_content)
 
-    # db2bind uses a dummy SYSIN (BIND subcommands need no SQL input)
-    dummy_sysin_content = " "
-
-    temp_systsin = None
-    temp_sysin = None
+    systsin_path = None
 
     try:
-        temp_systsin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.systsin')
-        temp_systsin.write(systsin_content)
-        temp_systsin.close()
-
-        temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-        temp_sysin.write(dummy_sysin_content)
-        temp_sysin.close()
+        # SYSTSIN work file, already in EBCDIC; shared by every call that
+        # generates the same SYSTSIN
+        systsin_path = _systsin_work_file(systsin_content, debug)
 
+        # db2bind uses a dummy SYSIN (BIND subcommands need no SQL input),
+        # written by tsocmd straight into its EBCDIC work file
         rc = tsocmd(
-            systsin_file=temp_systsin.name,
-            sysin_file=temp_sysin.name,
+            systsin_file=systsin_path,
+            sysin_file=None,
             systsprt_file=systsprt_file,
             sysprint_file=sysprint_file,
             steplib=steplib,
             dbrmlib=dbrmlib,
             library=library,
             debug=debug,
-            verbose=verbose
+            verbose=verbose,
+            sysin_content=" ",
+            systsin_encoding='IBM-1047'
         )
         
         return rc
@@ -791,20 +1499,33 @@ def db2bind(
         return 16
         
     finally:
-        # Clean up temporary files unless debug mode is enabled
-        if not debug:
-            if temp_systsin and os.path.exists(temp_systsin.name):
-                os.unlink(temp_systsin.name)
-            if temp_sysin and os.path.exists(temp_sysin.name):
-                os.unlink(temp_sysin.name)
-        else:
-            # In debug mode, print locations of preserved files
-            if verbose:
-                print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
-                if temp_systsin and os.path.exists(temp_systsin.name):
-                    print(f"SYSTSIN: {temp_systsin.name}", file=sys.stderr)
-                if temp_sysin and os.path.exists(temp_sysin.name):
-                    print(f"SYSIN: {temp_sysin.name}", file=sys.stderr)
+        # The SYSTSIN work file is kept: for reuse (it is removed at exit),
+        # or in debug mode for inspection, when its location is printed
+        if debug and verbose:
+            print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
+            if systsin_path:
+                print(f"SYSTSIN: {systsin_path}", file=sys.stderr)
+
+
+def _run_program_systsin(system: str, program: str, plan: str, toollib: str,
+                         parms: str | None = None) -> str:
+    """
+    Build the SYSTSIN for db2run(): DSN SYSTEM(...) and a RUN PROGRAM
+    subcommand with the optional PARM string.
+
+    Returns:
+        The SYSTSIN content, one line per record
+    """
+    if parms:
+        lib_line = f"       LIB('{toollib}') PARM('{parms}')"
+    else:
+        lib_line = f"       LIB('{toollib}')"
+
+    return f"""  DSN SYSTEM({system})
+  RUN PROGRAM({program}) PLAN({plan}) -
+{lib_line}
+  END
+"""
 
 
 def db2run(
@@ -813,7 +1534,7 @@ def db2run(
     plan: str | None = None,
     toollib: str | None = None,
     parms: str | None = None,
-    steplib: str | list[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     debug: bool = False,
@@ -831,7 +1552,7 @@ def db2run(
         plan: Db2 plan name bound for the program (required)
         toollib: Load library containing the program (required)
         parms: Optional PARM string to pass to the program
-        steplib: Optional STEPLIB dataset name(s) - single string or list for concatenation
+        steplib: Optional STEPLIB dataset name(s) - single string or iterable for concatenation
         systsprt_file: Path to SYSTSPRT output file or 'stdout' (defaults to 'stdout')
         sysprint_file: Path to SYSPRINT output file or 'stdout' (defaults to 'stdout')
         debug: Preserve temporary files for debugging (do not delete)
@@ -858,44 +1579,31 @@ def db2run(
         print("ERROR: toollib parameter is required", file=sys.stderr)
         return 8
 
-    temp_systsin = None
-    temp_sysin = None
+    systsin_path = None
 
     try:
-        # Build RUN PROGRAM subcommand
-        run_line = f"  RUN PROGRAM({program}) PLAN({plan}) -"
-        if parms:
-            lib_line = f"       LIB('{toollib}') PARM('{parms}')"
-        else:
-            lib_line = f"       LIB('{toollib}')"
-
-        systsin_content = f"""  DSN SYSTEM({system})
-{run_line}
-{lib_line}
-  END
-"""
+        systsin_content = _run_program_systsin(system, program, plan, toollib, parms)
 
         if verbose:
             print("Generated SYSTSIN content:")
             print(systsin_content)
 
-        temp_systsin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.systsin')
-        temp_systsin.write(systsin_content)
-        temp_systsin.close()
-
-        # db2run uses a dummy SYSIN
-        temp_sysin = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.sysin')
-        temp_sysin.write(" ")
-        temp_sysin.close()
+        # SYSTSIN work file, already in EBCDIC; shared by every call that
+        # generates the same SYSTSIN
+        systsin_path = _systsin_work_file(systsin_content, debug)
 
+        # db2run uses a dummy SYSIN, written by tsocmd straight into its
+        # EBCDIC work file
         rc = tsocmd(
-            systsin_file=temp_systsin.name,
-            sysin_file=temp_sysin.name,
+            systsin_file=systsin_path,
+            sysin_file=None,
             systsprt_file=systsprt_file,
             sysprint_file=sysprint_file,
             steplib=steplib,
             debug=debug,
-            verbose=verbose
+            verbose=verbose,
+            sysin_content=" ",
+            systsin_encoding='IBM-1047'
         )
 
         return rc
@@ -905,20 +1613,12 @@ def db2run(
         return 16
 
     finally:
-        # Clean up temporary files unless debug mode is enabled
-        if not debug:
-            if temp_systsin and os.path.exists(temp_systsin.name):
-                os.unlink(temp_systsin.name)
-            if temp_sysin and os.path.exists(temp_sysin.name):
-                os.unlink(temp_sysin.name)
-        else:
-            # In debug mode, print locations of preserved files
-            if verbose:
-                print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
-                if temp_systsin and os.path.exists(temp_systsin.name):
-                    print(f"SYSTSIN: {temp_systsin.name}", file=sys.stderr)
-                if temp_sysin and os.path.exists(temp_sysin.name):
-                    print(f"SYSIN: {temp_sysin.name}", file=sys.stderr)
+        # The SYSTSIN work file is kept: for reuse (it is removed at exit),
+        # or in debug mode for inspection, when its location is printed
+        if debug and verbose:
+            print("\n=== DEBUG: Temporary files preserved ===", file=sys.stderr)
+            if systsin_path:
+                print(f"SYSTSIN: {systsin_path}", file=sys.stderr)
 
 
 # ---------------------------------------------------------------------------
@@ -931,13 +1631,18 @@ def db2cmd(
     system: str | None = None,
     plan: str | None = None,
     toollib: str | None = None,
-    dbrmlib: str | list[str] | None = None,
-    steplib: str | list[str] | None = None,
+    dbrmlib: str | Iterable[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     verbose: bool = False
 ) -> int:
     """Deprecated: use db2sql() instead."""
+    # Unlike db2sql(), db2cmd() never had a default plan
+    if plan is None:
+        print("ERROR: plan parameter is required", file=sys.stderr)
+        return 8
+
     return db2sql(
         sysin_content=sysin_content,
         sysin_file=sysin_file,
@@ -958,7 +1663,7 @@ def db2admin(
     system: str | None = None,
     plan: str | None = None,
     toollib: str | None = None,
-    steplib: str | list[str] | None = None,
+    steplib: str | Iterable[str] | None = None,
     systsprt_file: str = 'stdout',
     sysprint_file: str = 'stdout',
     verbose: bool = False
@@ -977,12 +1682,7 @@ def db2admin(
     )
 
 
-def main():
-    """Main entry point"""
-    parser = argparse.ArgumentParser(
-        description='Execute TSO commands via IKJEFT1B with encoding conversion',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   # Basic usage (both SYSTSPRT and SYSPRINT go to stdout)
   batchtsocmd.py --systsin systsin.txt --sysin input.txt
@@ -1009,69 +1709,53 @@ Note: Input files can be ASCII (ISO8859-1) or EBCDIC (IBM-1047).
       Both --systsprt and --sysprint default to 'stdout'.
       When stdout is used, SYSTSPRT output is written first, then SYSPRINT output.
 """
-    )
-    
-    parser.add_argument(
-        '--systsin',
-        required=True,
-        help='Path to SYSTSIN input file'
-    )
-    
-    parser.add_argument(
-        '--sysin',
-        required=True,
-        help='Path to SYSIN input file'
-    )
-    
-    parser.add_argument(
-        '--systsprt',
-        default='stdout',
-        help="Path to SYSTSPRT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--sysprint',
-        default='stdout',
-        help="Path to SYSPRINT output file or 'stdout' (default: stdout)"
-    )
-    
-    parser.add_argument(
-        '--steplib',
-        help='Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets (e.g., DB2V13.SDSNLOAD or DB2V13.SDSNLOAD:DB2V13.SDSNLOD2)'
-    )
-    
-    parser.add_argument(
-        '--dbrmlib',
-        help='Optional DBRMLIB dataset name(s). Use colon to concatenate multiple datasets (e.g., DB2V13.DBRMLIB or DB2V13.DBRMLIB:DB2V13.DBRMLI2)'
-    )
-    
-    parser.add_argument(
-        '-v', '--verbose',
-        action='store_true',
-        help='Enable verbose output'
-    )
-    
-    parser.add_argument(
-        '--version',
-        action='version',
-        version=f'%(prog)s {__version__}'
-    )
-    
-    args = parser.parse_args()
+
+# Arguments as (flags, add_argument() keywords)
+_ARGUMENTS: tuple[ArgSpec, ...] = (
+    (('--systsin',), {'required': True, 'help': 'Path to SYSTSIN input file'}),
+    (('--sysin',), {'required': True, 'help': 'Path to SYSIN input file'}),
+    SYSTSPRT_ARG,
+    SYSPRINT_ARG,
+    (('--steplib',), {'help': 'Optional STEPLIB dataset name(s). Use colon to concatenate multiple datasets (e.g., DB2V13.SDSNLOAD or DB2V13.SDSNLOAD:DB2V13.SDSNLOD2)'}),
+    (('--dbrmlib',), {'help': 'Optional DBRMLIB dataset name(s). Use colon to concatenate multiple datasets (e.g., DB2V13.DBRMLIB or DB2V13.DBRMLIB:DB2V13.DBRMLI2)'}),
+    VERBOSE_ARG,
+    VERSION_ARG,
+)
+
+_PARSER: 'argparse.ArgumentParser | None' = None
+
+
+def _get_parser() -> 'argparse.ArgumentParser':
+    """Return the batchtsocmd argument parser, building it on first use"""
+    global _PARSER
+    if _PARSER is None:
+        import argparse
+        _PARSER = argparse.ArgumentParser(
+            description='Execute TSO commands via IKJEFT1B with encoding conversion',
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=_EPILOG
+        )
+        add_arguments(_PARSER, _ARGUMENTS)
+    return _PARSER
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point"""
+    args = _get_parser().parse_args(argv)
     
     # Parse steplib and dbrmlib arguments (support colon-separated concatenation)
-    steplib_list = args.steplib.split(':') if args.steplib else None
-    dbrmlib_list = args.dbrmlib.split(':') if args.dbrmlib else None
+    steplib_list = split_colon(args.steplib)
+    dbrmlib_list = split_colon(args.dbrmlib)
     
     # Execute the TSO command
     rc = tsocmd(
-        args.systsin,
-        args.sysin,
-        args.systsprt,
-        args.sysprint,
-        steplib_list,
-        dbrmlib_list,
-        args.verbose
+        systsin_file=args.systsin,
+        sysin_file=args.sysin,
+        systsprt_file=args.systsprt,
+        sysprint_file=args.sysprint,
+        steplib=steplib_list,
+        dbrmlib=dbrmlib_list,
+        verbose=args.verbose
     )
     
     return rc
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test the batchtsocmd.cli subcommand dispatcher
+"""
+
+import unittest
+from unittest import mock
+from batchtsocmd import cli, db2_cli, db2admin_cli, db2bind_cli, db2op_cli, db2run_cli, db2sql_cli
+
+
+class TestCliDispatch(unittest.TestCase):
+    """Test that each subcommand parses and dispatches like its own CLI (no z/OS connection required)"""
+
+    # (subcommand, CLI module, subcommand arguments)
+    COMMANDS = (
+        ('db2sql', db2sql_cli, ['SELECT 1 FROM SYSIBM.SYSDUMMY1', '--system', 'DB2P', '--batch-size', '5']),
+        ('db2op', db2op_cli, ['-DISPLAY DATABASE(*)', '--system', 'DB2P', '--plan', 'DSNTIAD']),
+        ('db2bind', db2bind_cli, ['--system', 'DB2P', '--package', 'PCBSA', '--member', 'CREACC', '--member', 'CRECUST']),
+        ('db2run', db2run_cli, ['--program', 'BANKDATA', '--plan', 'CBSA', '--toollib', 'CBSA.CICSBSA.LOADLIB']),
+        ('db2cmd', db2_cli, ['--system', 'DB2P', '--plan', 'DSNTEP12', '--verbose']),
+        ('db2admin', db2admin_cli, ['--system', 'DB2P', '--plan', 'DSNTIAD']),
+    )
+
+    def test_01_cli_dispatch(self):
+        """Test that each subcommand runs its module's _run() with the module's own arguments"""
+        # The dispatcher binds each module's _run() when its parser is built,
+        # so a new parser is built after patching it
+        for rc, (name, module, argv) in enumerate(self.COMMANDS, start=1):
+            with self.subTest(name), \
+                    mock.patch.object(cli, '_PARSER', None), \
+                    mock.patch.object(module, '_run', return_value=rc) as run_mock:
+                self.assertEqual(cli.main([name, *argv]), rc, "Expected the subcommand's return code")
+
+                run_mock.assert_called_once()
+                args = vars(run_mock.call_args.args[0])
+                self.assertEqual(args.pop('_command'), name)
+                self.assertIs(args.pop('_run'), run_mock)
+                self.assertEqual(args, vars(module._build_parser().parse_args(argv)),
+                                 "Expected the same arguments as the standalone command")
+
+    def test_02_cli_subparser_help(self):
+        """Test that each subparser uses its module's description and epilog"""
+        subparsers = next(action for action in cli._get_parser()._actions
+                          if action.dest == '_command')
+        self.assertEqual(set(subparsers.choices), {name for name, _, _ in self.COMMANDS})
+        for name, module, _ in self.COMMANDS:
+            with self.subTest(name):
+                subparser = subparsers.choices[name]
+                self.assertEqual(subparser.description, module._DESCRIPTION)
+                self.assertEqual(subparser.epilog, module._EPILOG)
+
+    def test_03_cli_requires_command(self):
+        """Test that the dispatcher rejects a missing or unknown subcommand with a usage error"""
+        for argv in ([], ['db2nothing']):
+            with self.subTest(argv=argv), \
+                    mock.patch('sys.stderr'), \
+                    self.assertRaises(SystemExit) as cm:
+                cli.main(argv)
+            self.assertEqual(cm.exception.code, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Made with Bob
@@ -104,8 +104,10 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information
-            print(f"\n=== Single STEPLIB Test RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== Single STEPLIB Test RC={rc} ===\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail due to invalid subsystem)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -172,8 +174,10 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information
-            print(f"\n=== Concatenated STEPLIB Test RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== Concatenated STEPLIB Test RC={rc} ===\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail due to invalid subsystem)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -241,8 +245,10 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information
-            print(f"\n=== Single DBRMLIB Test RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== Single DBRMLIB Test RC={rc} ===\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail due to invalid subsystem)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -310,8 +316,10 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information
-            print(f"\n=== Concatenated STEPLIB and DBRMLIB Test RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== Concatenated STEPLIB and DBRMLIB Test RC={rc} ===\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail due to invalid subsystem)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
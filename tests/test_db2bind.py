@@ -3,154 +3,162 @@
 Test Db2 BIND command execution using db2bind
 """
 
+import importlib
+import logging
 import os
-import sys
 import tempfile
 import unittest
+from types import MappingProxyType
+from unittest import mock
 from batchtsocmd.main import db2bind
 
+# The module itself: the package attribute 'main' is the main() function
+main_module = importlib.import_module('batchtsocmd.main')
 
-class TestDb2BindValidation(unittest.TestCase):
-    """Test db2bind parameter validation (no z/OS connection required)"""
+log = logging.getLogger(__name__)
 
-    def test_01_db2bind_missing_system(self):
-        """Test db2bind validation - system parameter is required"""
-        rc = db2bind(
-            package='PCBSA',
-            members=['CREACC'],
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when system parameter is missing")
+# Keywords shared by the package binds that pass validation
+_BIND_BASE = MappingProxyType({
+    'system': 'NOOK',
+    'owner': 'IBMUSER',
+    'qualifier': 'IBMUSER',
+    'action': 'REPLACE',
+    'steplib': 'DB2V13.SDSNLOAD',
+})
 
-    def test_02_db2bind_missing_package_and_plan(self):
-        """Test db2bind validation - at least one of package or plan must be specified"""
-        rc = db2bind(
-            system='DB2P',
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when neither package nor plan is specified")
+# Members and package list of the CBSA application, as in DB2BIND.jcl
+_PCBSA_MEMBERS = ('CREACC', 'CRECUST', 'DBCRFUN', 'DELACC', 'DELCUS',
+                  'INQACC', 'INQACCCU', 'BANKDATA', 'UPDACC', 'XFRFUN')
+_PKLIST = ('NULLID.*', 'PCBSA.*')
 
-    def test_03_db2bind_package_without_members(self):
-        """Test db2bind validation - members required when package is specified"""
-        rc = db2bind(
-            system='DB2P',
-            package='PCBSA',
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when package specified without members")
-
-    def test_04_db2bind_plan_only_no_members_required(self):
-        """Test db2bind validation - plan-only bind does not require members"""
-        # This will fail at execution (invalid subsystem) but should pass validation
-        rc = db2bind(
-            system='NOOK',
-            plan='CBSA',
-            owner='IBMUSER',
-            isolation='UR',
-            pklist=['NULLID.*', 'PCBSA.*'],
-            steplib='DB2V13.SDSNLOAD',
-        )
-        # Should fail at execution (NOOK not valid), not at validation
-        self.assertNotEqual(rc, 8, "Validation should pass for plan-only bind")
 
-    def test_05_db2bind_package_with_single_member(self):
-        """Test db2bind with a single package member - fails at execution with invalid subsystem"""
-        rc = db2bind(
-            system='NOOK',
-            package='PCBSA',
-            members=['CREACC'],
-            owner='IBMUSER',
-            qualifier='IBMUSER',
-            action='REPLACE',
-            steplib='DB2V13.SDSNLOAD',
-        )
-        # Should fail at execution (NOOK not valid), not at validation
-        self.assertNotEqual(rc, 8, "Validation should pass for single-member package bind")
+class TestDb2BindValidation(unittest.TestCase):
+    """Test db2bind parameter validation (no z/OS connection required)"""
 
-    def test_06_db2bind_package_and_plan_together(self):
-        """Test db2bind with both package members and plan - mirrors DB2BIND.jcl"""
-        rc = db2bind(
-            system='NOOK',
-            package='PCBSA',
-            members=['CREACC', 'CRECUST', 'DBCRFUN', 'DELACC', 'DELCUS',
-                     'INQACC', 'INQACCCU', 'BANKDATA', 'UPDACC', 'XFRFUN'],
-            owner='IBMUSER',
-            qualifier='IBMUSER',
-            action='REPLACE',
-            plan='CBSA',
-            isolation='UR',
-            pklist=['NULLID.*', 'PCBSA.*'],
-            steplib='DB2V13.SDSNEXIT:DB2V13.SDSNLOAD',
-        )
-        # Should fail at execution (NOOK not valid), not at validation
-        self.assertNotEqual(rc, 8, "Validation should pass for combined package+plan bind")
-
-    def test_07_db2bind_invalid_action(self):
-        """Test db2bind with invalid action - argparse handles this at CLI level,
-        but the Python function accepts any string for action"""
-        # The Python function itself does not validate action values
-        # (that is the CLI's job via argparse choices). This test documents that.
-        rc = db2bind(
-            system='NOOK',
-            package='PCBSA',
-            members=['CREACC'],
-            action='REPLACE',  # valid
-            steplib='DB2V13.SDSNLOAD',
-        )
-        self.assertNotEqual(rc, 8, "Validation should pass with valid action")
+    fn = staticmethod(db2bind)
+
+    @classmethod
+    def setUpClass(cls):
+        # Only validation is tested here, so the SYSTSIN work file and
+        # tsocmd() are replaced once for the whole class: calls that pass
+        # validation return 99 at once, with no file written and no IKJEFT1B
+        patcher = mock.patch.object(main_module, '_systsin_work_file', return_value='SYSTSIN')
+        cls.systsin_work_file = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        patcher = mock.patch.object(main_module, 'tsocmd', return_value=99)
+        cls.tsocmd = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        self.systsin_work_file.reset_mock()
+        self.tsocmd.reset_mock()
+
+    def assertValidationPassed(self, rc, message):
+        """Assert that a call passed validation and reached tsocmd() once"""
+        self.assertEqual(rc, 99, message)
+        self.tsocmd.assert_called_once()
+
+    def assertValidationRejected(self, rc, message):
+        """Assert that a call was rejected with rc 8 before any work was done"""
+        self.assertEqual(rc, 8, message)
+        self.systsin_work_file.assert_not_called()
+        self.tsocmd.assert_not_called()
+
+    # (name, db2bind() keywords, whether validation rejects them with rc 8,
+    # assertion message). Cases that pass validation get the patched
+    # tsocmd()'s return code.
+    VALIDATION_CASES = (
+        ('missing_system',
+         dict(package='PCBSA', members=['CREACC']),
+         True, "Expected error code 8 when system parameter is missing"),
+        ('missing_package_and_plan',
+         dict(system='DB2P'),
+         True, "Expected error code 8 when neither package nor plan is specified"),
+        ('package_without_members',
+         dict(system='DB2P', package='PCBSA'),
+         True, "Expected error code 8 when package specified without members"),
+        # A plan-only bind does not require members
+        ('plan_only_no_members_required',
+         dict(system='NOOK', plan='CBSA', owner='IBMUSER', isolation='UR',
+              pklist=_PKLIST, steplib='DB2V13.SDSNLOAD'),
+         False, "Validation should pass for plan-only bind"),
+        ('package_with_single_member',
+         {**_BIND_BASE, 'package': 'PCBSA', 'members': ['CREACC']},
+         False, "Validation should pass for single-member package bind"),
+        # Both package members and plan - mirrors DB2BIND.jcl
+        ('package_and_plan_together',
+         {**_BIND_BASE, 'package': 'PCBSA', 'members': _PCBSA_MEMBERS,
+          'plan': 'CBSA', 'isolation': 'UR', 'pklist': _PKLIST,
+          'steplib': 'DB2V13.SDSNEXIT:DB2V13.SDSNLOAD'},
+         False, "Validation should pass for combined package+plan bind"),
+        # The Python function does not validate action values (that is the
+        # CLI's job via argparse choices)
+        ('valid_action',
+         dict(system='NOOK', package='PCBSA', members=['CREACC'], action='REPLACE',
+              steplib='DB2V13.SDSNLOAD'),
+         False, "Validation should pass with valid action"),
+    )
+
+    def test_01_db2bind_validation(self):
+        """Test db2bind validation of required and dependent parameters"""
+        for name, kwargs, rejected, message in self.VALIDATION_CASES:
+            with self.subTest(name):
+                self.setUp()
+                rc = self.fn(**kwargs)
+                if rejected:
+                    self.assertValidationRejected(rc, message)
+                else:
+                    self.assertValidationPassed(rc, message)
 
     def test_08_db2bind_library_and_dbrmlib_mutually_exclusive(self):
         """Test db2bind validation - library and dbrmlib are mutually exclusive"""
-        rc = db2bind(
+        rc = self.fn(
             system='DB2P',
             package='PCBSA',
             members=['CREACC'],
             dbrmlib='CBSA.CICSBSA.DBRM',
             library='/u/fultonm/projects/cbsa/obj',
         )
-        self.assertEqual(rc, 8, "Expected error code 8 when both library and dbrmlib specified")
+        self.assertValidationRejected(rc, "Expected error code 8 when both library and dbrmlib specified")
 
     def test_09_db2bind_library_path_not_exists(self):
         """Test db2bind validation - library path must exist"""
-        rc = db2bind(
+        rc = self.fn(
             system='DB2P',
             package='PCBSA',
             members=['CREACC'],
             library='/nonexistent/path/to/dbrms',
         )
-        self.assertEqual(rc, 8, "Expected error code 8 when library path does not exist")
+        self.assertValidationRejected(rc, "Expected error code 8 when library path does not exist")
 
     def test_10_db2bind_library_with_single_member(self):
-        """Test db2bind with filesystem library - fails at execution with invalid subsystem"""
+        """Test db2bind with filesystem library passes validation"""
         # Create a temporary directory for testing
         with tempfile.TemporaryDirectory() as tmpdir:
-            rc = db2bind(
-                system='NOOK',
+            rc = self.fn(
+                **_BIND_BASE,
                 package='PCBSA',
                 members=['CREACC'],
-                owner='IBMUSER',
-                qualifier='IBMUSER',
-                action='REPLACE',
                 library=tmpdir,
-                steplib='DB2V13.SDSNLOAD',
             )
-            # Should fail at execution (NOOK not valid), not at validation
-            self.assertNotEqual(rc, 8, "Validation should pass for filesystem library bind")
+            # Should pass validation and reach tsocmd()
+            self.assertValidationPassed(rc, "Validation should pass for filesystem library bind")
 
     def test_11_db2bind_library_with_dbrm_extension(self):
         """Test db2bind strips .dbrm extension from member names"""
         with tempfile.TemporaryDirectory() as tmpdir:
-            rc = db2bind(
-                system='NOOK',
+            rc = self.fn(
+                **_BIND_BASE,
                 package='PCBSA',
                 members=['CREACC.dbrm', 'CRECUST.DBRM'],
-                owner='IBMUSER',
-                qualifier='IBMUSER',
                 library=tmpdir,
-                steplib='DB2V13.SDSNLOAD',
                 verbose=True,
             )
-            # Should fail at execution but pass validation
-            self.assertNotEqual(rc, 8, "Validation should pass with .dbrm extensions")
+            # Should pass validation and reach tsocmd()
+            self.assertValidationPassed(rc, "Validation should pass with .dbrm extensions")
 
 
+@unittest.skipUnless(os.environ.get('DB2_SYSTEM'), "DB2_SYSTEM environment variable not set - skipping live execution tests")
 class TestDb2BindExecution(unittest.TestCase):
     """Test db2bind execution against a live Db2 subsystem.
 
@@ -158,59 +166,59 @@ class TestDb2BindExecution(unittest.TestCase):
     if DB2_SYSTEM is not set in the environment.
     """
 
-    def setUp(self):
-        self.system = os.environ.get('DB2_SYSTEM')
-        self.steplib = os.environ.get('DB2_STEPLIB')
-        self.dbrmlib = os.environ.get('DB2_DBRMLIB')
-        if not self.system:
-            self.skipTest("DB2_SYSTEM environment variable not set - skipping live execution tests")
+    fn = staticmethod(db2bind)
+
+    @classmethod
+    def setUpClass(cls):
+        # The environment is read once for the whole class
+        environ = os.environ
+        cls.system = environ['DB2_SYSTEM']
+        cls.steplib = environ.get('DB2_STEPLIB')
+        cls.dbrmlib = environ.get('DB2_DBRMLIB')
+        cls.library = environ.get('DB2_LIBRARY')
+        cls.plan = environ.get('DB2_PLAN', 'CBSA')
+        cls.owner = environ.get('DB2_OWNER', 'IBMUSER')
+        cls.package = environ.get('DB2_PACKAGE', 'PCBSA')
+        cls.member = environ.get('DB2_MEMBER', 'CREACC')
 
     def test_12_db2bind_live_plan_only(self):
         """Test db2bind BIND PLAN against a live Db2 subsystem"""
-        plan = os.environ.get('DB2_PLAN', 'CBSA')
-        owner = os.environ.get('DB2_OWNER', 'IBMUSER')
-        package = os.environ.get('DB2_PACKAGE', 'PCBSA')
-
-        rc = db2bind(
+        rc = self.fn(
             system=self.system,
-            plan=plan,
-            owner=owner,
+            plan=self.plan,
+            owner=self.owner,
             isolation='UR',
-            pklist=[f'NULLID.*', f'{package}.*'],
+            pklist=['NULLID.*', f'{self.package}.*'],
             steplib=self.steplib,
             verbose=True,
         )
 
-        print(f"\n=== db2bind live BIND PLAN RC={rc} ===", file=sys.stderr)
+        log.debug("=== db2bind live BIND PLAN RC=%s ===", rc)
         # RC 0 = success, RC 4 = warnings (acceptable for bind)
         self.assertLessEqual(rc, 4, f"Expected RC <= 4 for BIND PLAN, got RC={rc}")
 
     def test_13_db2bind_live_filesystem_package(self):
         """Test db2bind BIND PACKAGE with filesystem library against live Db2"""
-        library = os.environ.get('DB2_LIBRARY')
+        library = self.library
         if not library:
             self.skipTest("DB2_LIBRARY environment variable not set")
         
         if not os.path.isdir(library):
             self.skipTest(f"DB2_LIBRARY directory does not exist: {library}")
         
-        package = os.environ.get('DB2_PACKAGE', 'PCBSA')
-        owner = os.environ.get('DB2_OWNER', 'IBMUSER')
-        member = os.environ.get('DB2_MEMBER', 'CREACC')
-        
-        rc = db2bind(
+        rc = self.fn(
             system=self.system,
-            package=package,
-            members=[member],
-            owner=owner,
-            qualifier=owner,
+            package=self.package,
+            members=[self.member],
+            owner=self.owner,
+            qualifier=self.owner,
             action='REPLACE',
             library=library,
             steplib=self.steplib,
             verbose=True,
         )
         
-        print(f"\n=== db2bind live filesystem BIND PACKAGE RC={rc} ===", file=sys.stderr)
+        log.debug("=== db2bind live filesystem BIND PACKAGE RC=%s ===", rc)
         # RC 0 = success, RC 4 = warnings (acceptable for bind)
         self.assertLessEqual(rc, 4, f"Expected RC <= 4 for filesystem BIND PACKAGE, got RC={rc}")
 
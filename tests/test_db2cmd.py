@@ -3,12 +3,17 @@
 Test DB2 SQL execution using batchtsocmd and db2sql
 """
 
+import importlib
 import os
 import sys
 import tempfile
 import unittest
+from unittest import mock
 from batchtsocmd.main import tsocmd, db2sql, db2cmd  # db2cmd kept for backward-compat tests
 
+# The module itself: the package attribute 'main' is the main() function
+main_module = importlib.import_module('batchtsocmd.main')
+
 
 class TestDB2Commands(unittest.TestCase):
     """Test Db2 SQL execution via batchtsocmd (tsocmd layer)"""
@@ -85,9 +90,11 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information for verification
-            print(f"\n=== DB2 Command Result RC={rc} ===", file=sys.stderr)
-            print(f"SYSPRINT:\n{sysprint_output}", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== DB2 Command Result RC={rc} ===\n"
+                f"SYSPRINT:\n{sysprint_output}\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -170,9 +177,11 @@ CREATE DATABASE DUMMY
                 sysprint_output = f.read()
             
             # Print diagnostic information for verification
-            print(f"\n=== DB2 Command Result (SYSTSPRT to stdout) RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT (from stdout):\n{systsprt_output}", file=sys.stderr)
-            print(f"SYSPRINT (from file):\n{sysprint_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== DB2 Command Result (SYSTSPRT to stdout) RC={rc} ===\n"
+                f"SYSTSPRT (from stdout):\n{systsprt_output}\n"
+                f"SYSPRINT (from file):\n{sysprint_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -254,9 +263,11 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
             
             # Print diagnostic information for verification
-            print(f"\n=== DB2 Command Result (SYSPRINT to stdout) RC={rc} ===", file=sys.stderr)
-            print(f"SYSTSPRT (from file):\n{systsprt_output}", file=sys.stderr)
-            print(f"SYSPRINT (from stdout):\n{sysprint_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== DB2 Command Result (SYSPRINT to stdout) RC={rc} ===\n"
+                f"SYSTSPRT (from file):\n{systsprt_output}\n"
+                f"SYSPRINT (from stdout):\n{sysprint_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -334,8 +345,10 @@ CREATE DATABASE DUMMY
             combined_output = captured_output.getvalue()
             
             # Print diagnostic information for verification
-            print(f"\n=== DB2 Command Result (Both to stdout) RC={rc} ===", file=sys.stderr)
-            print(f"Combined stdout output:\n{combined_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== DB2 Command Result (Both to stdout) RC={rc} ===\n"
+                f"Combined stdout output:\n{combined_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -414,9 +427,11 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
 
             # Print diagnostic information for verification
-            print(f"\n=== db2sql with file RC={rc} ===", file=sys.stderr)
-            print(f"SYSPRINT:\n{sysprint_output}", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== db2sql with file RC={rc} ===\n"
+                f"SYSPRINT:\n{sysprint_output}\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -475,9 +490,11 @@ CREATE DATABASE DUMMY
                 systsprt_output = f.read()
 
             # Print diagnostic information for verification
-            print(f"\n=== db2sql with content RC={rc} ===", file=sys.stderr)
-            print(f"SYSPRINT:\n{sysprint_output}", file=sys.stderr)
-            print(f"SYSTSPRT:\n{systsprt_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== db2sql with content RC={rc} ===\n"
+                f"SYSPRINT:\n{sysprint_output}\n"
+                f"SYSTSPRT:\n{systsprt_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -602,8 +619,10 @@ CREATE DATABASE DUMMY
             combined_output = captured_output.getvalue()
 
             # Print diagnostic information for verification
-            print(f"\n=== db2sql with stdout RC={rc} ===", file=sys.stderr)
-            print(f"Combined stdout output:\n{combined_output}", file=sys.stderr)
+            sys.stderr.write(
+                f"\n=== db2sql with stdout RC={rc} ===\n"
+                f"Combined stdout output:\n{combined_output}\n"
+            )
             
             # Verify return code is non-zero (command should fail)
             self.assertNotEqual(rc, 0, f"Expected DB2 command to fail with invalid subsystem, but got RC={rc}")
@@ -619,6 +638,138 @@ CREATE DATABASE DUMMY
         except Exception as e:
             self.fail(f"Test failed with exception: {e}")
 
+    def test_13_db2sql_cli_split_statements(self):
+        """Test that --batch-size splits SQL only at semicolons outside quotes and comments"""
+        from batchtsocmd.db2sql_cli import _split_statements
+
+        sql = """SET CURRENT SQLID = 'A;B';
+-- it's a comment; not a statement
+/* a block comment; it's
+   not a statement either */
+GRANT SELECT ON TABLE "T;1" TO CICSUSER;
+SELECT 1 FROM SYSIBM.SYSDUMMY1
+"""
+        statements = _split_statements(sql)
+
+        self.assertEqual(len(statements), 3, f"Expected 3 statements, got: {statements}")
+        self.assertEqual(''.join(statements), sql, "Joined statements should reproduce the input")
+        self.assertEqual(_split_statements("A;B;\n"), ['A;', 'B;'])
+        self.assertEqual(_split_statements("A /* ; */;B /* ;"), ['A /* ; */;', 'B /* ;'])
+        # A tail holding only comments stays with the last statement
+        self.assertEqual(_split_statements("SELECT 1; -- done\n"), ['SELECT 1; -- done\n'])
+        self.assertEqual(_split_statements("A;\n/* end */\n"), ['A;\n/* end */\n'])
+        self.assertEqual(_split_statements("-- nothing to run\n"), [])
+
+    def test_14_db2sql_sysin_blocks(self):
+        """Test that a list of SQL blocks is joined into one terminated SYSIN"""
+        from batchtsocmd.main import _join_sysin_blocks
+
+        blocks = ["SET CURRENT SQLID = 'IBMUSER';", "GRANT EXECUTE ON PLAN CBSA TO CICSUSER\n", "  ", "SELECT 1 FROM SYSIBM.SYSDUMMY1;\n"]
+        self.assertEqual(
+            _join_sysin_blocks(blocks, ';'),
+            "SET CURRENT SQLID = 'IBMUSER';\n"
+            "GRANT EXECUTE ON PLAN CBSA TO CICSUSER;\n"
+            "SELECT 1 FROM SYSIBM.SYSDUMMY1;\n"
+        )
+        self.assertEqual(_join_sysin_blocks("SELECT 1 FROM SYSIBM.SYSDUMMY1", ';'), "SELECT 1 FROM SYSIBM.SYSDUMMY1")
+        self.assertIsNone(_join_sysin_blocks(None, ';'))
+        # No blocks, or only blank ones, give no SYSIN at all
+        self.assertIsNone(_join_sysin_blocks([], ';'))
+        self.assertIsNone(_join_sysin_blocks(['', '  \n'], ';'))
+        # The terminator is never added inside a trailing '--' comment
+        self.assertEqual(_join_sysin_blocks(['SELECT 1 -- x'], ';'), "SELECT 1 -- x\n;\n")
+        self.assertEqual(_join_sysin_blocks(['SELECT 1; -- x'], ';'), "SELECT 1; -- x\n")
+        self.assertEqual(_join_sysin_blocks(["SELECT '--' FROM T"], ';'), "SELECT '--' FROM T;\n")
+
+    def test_16_db2sql_sysin_blocks_validation(self):
+        """Test that db2sql rejects a list of SQL blocks with no SQL in it"""
+        with mock.patch.object(main_module, 'tsocmd') as tsocmd_mock:
+            for blocks in ([], ['', '   ']):
+                with self.subTest(blocks=blocks):
+                    rc = db2sql(
+                        sysin_content=blocks,
+                        system='DB2P',
+                        toollib='DSNC10.DBCG.RUNLIB.LOAD'
+                    )
+                    self.assertEqual(rc, 8, "Expected error code 8 when no SQL blocks are provided")
+        tsocmd_mock.assert_not_called()
+
+    def test_17_db2sql_sysin_blocks_content(self):
+        """Test the SYSIN that db2sql passes to tsocmd for a list of SQL blocks"""
+        with mock.patch.object(main_module, '_systsin_work_file', return_value='SYSTSIN'), \
+                mock.patch.object(main_module, 'tsocmd', return_value=0) as tsocmd_mock:
+            rc = db2sql(
+                sysin_content=["SET CURRENT SQLID = 'IBMUSER'", "", "SELECT 1 FROM SYSIBM.SYSDUMMY1 -- one\n"],
+                system='DB2P',
+                toollib='DSNC10.DBCG.RUNLIB.LOAD'
+            )
+
+        self.assertEqual(rc, 0)
+        tsocmd_mock.assert_called_once()
+        self.assertEqual(
+            tsocmd_mock.call_args.kwargs['sysin_content'],
+            "SET CURRENT SQLID = 'IBMUSER';\n"
+            "SELECT 1 FROM SYSIBM.SYSDUMMY1 -- one\n"
+            ";\n"
+        )
+
+    def test_15_db2sql_read_sysin_text(self):
+        """Test that --batch-size reads ASCII and UTF-8 SQL files unchanged"""
+        from batchtsocmd.main import read_sysin_text
+
+        sql = "SET CURRENT SQLID = 'IBMUSER';\nCOMMENT ON TABLE T IS 'Café';\n"
+        with tempfile.NamedTemporaryFile('wb', suffix='.sql', delete=False) as f:
+            f.write(sql.encode('utf-8'))
+        try:
+            self.assertEqual(read_sysin_text(f.name), sql)
+        finally:
+            os.unlink(f.name)
+
+    def test_18_db2sql_cli_unreadable_file(self):
+        """Test that the db2sql CLI rejects an SQL file it cannot stat with rc 8"""
+        from batchtsocmd.db2sql_cli import main as db2sql_main
+
+        with tempfile.NamedTemporaryFile(suffix='.sql') as f:
+            # A path below a regular file fails with NotADirectoryError
+            rc = db2sql_main(['--file', os.path.join(f.name, 'query.sql'),
+                              '--system', 'DB2P', '--toollib', 'DSNC10.DBCG.RUNLIB.LOAD'])
+
+        self.assertEqual(rc, 8, "Expected error code 8 when the SQL file cannot be read")
+
+
+class TestDb2CmdFunction(unittest.TestCase):
+    """Test deprecated db2cmd wrapper"""
+
+    def test_01_db2cmd_positional_arguments(self):
+        """Test db2cmd keeps its original positional parameter order"""
+        with mock.patch.object(main_module, 'db2sql', return_value=4) as db2sql_mock:
+            rc = db2cmd("SELECT 1 FROM SYSIBM.SYSDUMMY1;", None, 'DB2P', 'DSNTEP12', 'DSNC10.DBCG.RUNLIB.LOAD',
+                        'CBSA.CICSBSA.DBRM', 'DB2V13.SDSNLOAD', 'systsprt.out', 'sysprint.out', True)
+
+        self.assertEqual(rc, 4)
+        db2sql_mock.assert_called_once_with(
+            sysin_content="SELECT 1 FROM SYSIBM.SYSDUMMY1;",
+            sysin_file=None,
+            system='DB2P',
+            plan='DSNTEP12',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD',
+            dbrmlib='CBSA.CICSBSA.DBRM',
+            steplib='DB2V13.SDSNLOAD',
+            systsprt_file='systsprt.out',
+            sysprint_file='sysprint.out',
+            verbose=True
+        )
+
+    def test_02_db2cmd_validation_missing_plan(self):
+        """Test db2cmd validation - plan parameter is required (no DSNTEP2 default)"""
+        rc = db2cmd(
+            sysin_content="SELECT * FROM SYSIBM.SYSTABLES;",
+            system='DB2P',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when plan parameter is missing")
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Test Db2 operator command execution using db2op
+"""
+
+import contextlib
+import importlib
+import io
+import mmap
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from batchtsocmd.main import db2op, db2admin  # db2admin kept for backward-compat
+
+# The module itself: the package attribute 'main' is the main() function
+main_module = importlib.import_module('batchtsocmd.main')
+
+
+class TestDb2OpFunction(unittest.TestCase):
+    """Test db2op function (replaces db2admin)"""
+
+    @classmethod
+    def setUpClass(cls):
+        # One directory holds every test's files and is removed in one go
+        cls._tmpdir = tempfile.TemporaryDirectory(prefix='test_db2op_')
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmpdir.cleanup()
+
+    def _work_file(self, suffix, content=''):
+        """Create a file for the running test in the class directory and return its path"""
+        path = os.path.join(self._tmpdir.name, self._testMethodName + suffix)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def _assert_in_ebcdic_file(self, path, expected):
+        """Assert that an IBM-1047 output file contains expected, without decoding it"""
+        needle = expected.encode('ibm1047')
+        with open(path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                found = False
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    found = data.find(needle) != -1
+            if not found:
+                f.seek(0)
+                output = f.read().decode('ibm1047', errors='replace')
+                self.fail(f"Expected '{expected}' in {os.path.basename(path)}, but got: {output}")
+
+    def test_01_db2op_with_file(self):
+        """Test db2op function with sysin_file parameter"""
+        # SYSIN content - DB2 administrative commands
+        sysin_content = """-DISPLAY DATABASE(*)
+"""
+        
+        # Create test files
+        sysin_path = self._work_file('.sysin', sysin_content)
+        sysprint_path = self._work_file('.sysprint')
+        systsprt_path = self._work_file('.systsprt')
+        
+        # Run db2op with file
+        rc = db2op(
+            sysin_file=sysin_path,
+            system='NOOK',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD',
+            sysprint_file=sysprint_path,
+            systsprt_file=systsprt_path,
+            steplib='DB2V13.SDSNLOAD',
+            verbose=False
+        )
+
+        # Print diagnostic information for verification
+        print(f"\n=== db2op with file RC={rc} ===", file=sys.stderr)
+        
+        # Verify return code is non-zero (command should fail with invalid subsystem)
+        self.assertNotEqual(rc, 0, f"Expected DB2 admin command to fail with invalid subsystem, but got RC={rc}")
+        
+        # Verify SYSTSPRT contains the expected error message
+        self._assert_in_ebcdic_file(systsprt_path, "NOOK NOT VALID SUBSYSTEM ID, COMMAND TERMINATED")
+    
+    def test_02_db2op_with_content(self):
+        """Test db2op function with sysin_content parameter"""
+        # SYSIN content - DB2 administrative commands
+        sysin_content = """-DISPLAY DATABASE(*)
+"""
+        
+        # Create test output files
+        sysprint_path = self._work_file('.sysprint')
+        systsprt_path = self._work_file('.systsprt')
+        
+        # Run db2op with content string
+        rc = db2op(
+            sysin_content=sysin_content,
+            system='NOOK',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD',
+            sysprint_file=sysprint_path,
+            systsprt_file=systsprt_path,
+            steplib='DB2V13.SDSNLOAD',
+            verbose=False
+        )
+
+        # Print diagnostic information for verification
+        print(f"\n=== db2op with content RC={rc} ===", file=sys.stderr)
+        
+        # Verify return code is non-zero (command should fail with invalid subsystem)
+        self.assertNotEqual(rc, 0, f"Expected DB2 admin command to fail with invalid subsystem, but got RC={rc}")
+        
+        # Verify SYSTSPRT contains the expected error message
+        self._assert_in_ebcdic_file(systsprt_path, "NOOK NOT VALID SUBSYSTEM ID, COMMAND TERMINATED")
+    
+    def test_03_db2op_validation_both_sysin(self):
+        """Test db2op validation - cannot specify both sysin_content and sysin_file"""
+        # Create a SYSIN file
+        sysin_path = self._work_file('.sysin', "-DISPLAY DATABASE(*)")
+
+        # Try to call db2op with both parameters - should fail
+        rc = db2op(
+            sysin_content="-DISPLAY DATABASE(*)",
+            sysin_file=sysin_path,
+            system='DB2P',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when both sysin_content and sysin_file are specified")
+
+    def test_04_db2op_validation_no_sysin(self):
+        """Test db2op validation - must specify either sysin_content or sysin_file"""
+        rc = db2op(
+            system='DB2P',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when neither sysin_content nor sysin_file are specified")
+
+    def test_05_db2op_validation_missing_system(self):
+        """Test db2op validation - system parameter is required"""
+        rc = db2op(
+            sysin_content="-DISPLAY DATABASE(*)",
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when system parameter is missing")
+
+    def test_06_db2op_validation_missing_plan(self):
+        """Test db2op validation - plan parameter is required"""
+        rc = db2op(
+            sysin_content="-DISPLAY DATABASE(*)",
+            system='DB2P',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when plan parameter is missing")
+
+    def test_07_db2op_validation_missing_toollib(self):
+        """Test db2op validation - toollib parameter is required"""
+        rc = db2op(
+            sysin_content="-DISPLAY DATABASE(*)",
+            system='DB2P',
+            plan='DSNTIAD'
+        )
+
+        # Should return error code 8
+        self.assertEqual(rc, 8, "Expected error code 8 when toollib parameter is missing")
+
+    def test_08_db2op_with_stdout(self):
+        """Test db2op with both outputs to stdout"""
+        # SYSIN content - Db2 operator commands
+        sysin_content = """-DISPLAY DATABASE(*)
+"""
+
+        # Capture stdout as bytes: copy_ebcdic_to_stdout() writes plain ASCII
+        # output straight to sys.stdout.buffer
+        captured_output = io.BytesIO()
+        stdout = io.TextIOWrapper(captured_output, encoding='latin-1', write_through=True)
+        with contextlib.redirect_stdout(stdout):
+            # Run db2op with both outputs to stdout
+            rc = db2op(
+                sysin_content=sysin_content,
+                system='NOOK',
+                plan='DSNTIAD',
+                toollib='DSNC10.DBCG.RUNLIB.LOAD',
+                sysprint_file='stdout',
+                systsprt_file='stdout',
+                steplib='DB2V13.SDSNLOAD',
+                verbose=False
+            )
+            stdout.flush()
+
+        combined_output = captured_output.getvalue()
+
+        # Print diagnostic information for verification
+        print(f"\n=== db2op with stdout RC={rc} ===", file=sys.stderr)
+
+        # Verify return code is non-zero (command should fail with invalid subsystem)
+        self.assertNotEqual(rc, 0, f"Expected DB2 admin command to fail with invalid subsystem, but got RC={rc}")
+
+        # Verify the expected error message appears in output
+        expected_error = "NOOK NOT VALID SUBSYSTEM ID, COMMAND TERMINATED"
+        self.assertIn(
+            expected_error.encode('latin-1'),
+            combined_output,
+            f"Expected error message '{expected_error}' in combined stdout, but got: {combined_output.decode('latin-1')}"
+        )
+
+    def test_09_db2op_batch(self):
+        """Test db2op with a list of command blocks run in one invocation"""
+        sysin_blocks = [f"DISPLAY DATABASE(DSNDB{n:02d})" for n in range(10)]
+
+        systsprt_path = self._work_file('.systsprt')
+
+        rc = db2op(
+            sysin_content=sysin_blocks,
+            system='NOOK',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD',
+            sysprint_file=self._work_file('.sysprint'),
+            systsprt_file=systsprt_path,
+            steplib='DB2V13.SDSNLOAD',
+            verbose=False
+        )
+
+        # Print diagnostic information for verification
+        print(f"\n=== db2op batch RC={rc} ===", file=sys.stderr)
+
+        # The one DSN session fails for the invalid subsystem, as for a single command
+        self.assertNotEqual(rc, 0, f"Expected DB2 admin command to fail with invalid subsystem, but got RC={rc}")
+        self._assert_in_ebcdic_file(systsprt_path, "NOOK NOT VALID SUBSYSTEM ID, COMMAND TERMINATED")
+
+    def test_10_db2op_batch_validation(self):
+        """Test that db2op rejects a list of command blocks with no commands in it"""
+        with mock.patch.object(main_module, 'tsocmd') as tsocmd_mock:
+            for blocks in ([], ['', '   ']):
+                with self.subTest(blocks=blocks):
+                    rc = db2op(
+                        sysin_content=blocks,
+                        system='DB2P',
+                        plan='DSNTIAD',
+                        toollib='DSNC10.DBCG.RUNLIB.LOAD'
+                    )
+                    self.assertEqual(rc, 8, "Expected error code 8 when no command blocks are provided")
+        tsocmd_mock.assert_not_called()
+
+    def test_11_db2op_batch_content(self):
+        """Test the SYSIN that db2op passes to tsocmd for a list of command blocks"""
+        with mock.patch.object(main_module, '_systsin_work_file', return_value='SYSTSIN'), \
+                mock.patch.object(main_module, 'tsocmd', return_value=0) as tsocmd_mock:
+            rc = db2op(
+                sysin_content=["DISPLAY DATABASE(*)", "  ", "-STOP DATABASE(DUMMY)\n  START DATABASE(DUMMY)\n"],
+                system='DB2P',
+                plan='DSNTIAD',
+                toollib='DSNC10.DBCG.RUNLIB.LOAD'
+            )
+
+        self.assertEqual(rc, 0)
+        tsocmd_mock.assert_called_once()
+        self.assertEqual(
+            tsocmd_mock.call_args.kwargs['sysin_content'],
+            "-DISPLAY DATABASE(*)\n"
+            "-STOP DATABASE(DUMMY)\n"
+            "-START DATABASE(DUMMY)\n"
+        )
+
+    def test_12_db2op_line_endings(self):
+        """Test that db2op adds the '-' prefix after every kind of line ending"""
+        with mock.patch.object(main_module, '_systsin_work_file', return_value='SYSTSIN'), \
+                mock.patch.object(main_module, 'tsocmd', return_value=0) as tsocmd_mock:
+            db2op(
+                sysin_content="DIS DB(*)\rSTA DB(DUMMY)\r\nSTO DB(DUMMY)\x0b -DIS THD(*)",
+                system='DB2P',
+                plan='DSNTIAD',
+                toollib='DSNC10.DBCG.RUNLIB.LOAD'
+            )
+
+        self.assertEqual(
+            tsocmd_mock.call_args.kwargs['sysin_content'],
+            "-DIS DB(*)\n-STA DB(DUMMY)\n-STO DB(DUMMY)\n -DIS THD(*)\n"
+        )
+
+
+class TestDb2AdminFunction(unittest.TestCase):
+    """Test deprecated db2admin wrapper"""
+
+    # db2admin only forwards to db2op, so instead of repeating the db2op
+    # tests (and their IKJEFT1B runs) this checks what it passes on
+
+    def test_01_db2admin_positional_arguments(self):
+        """Test db2admin keeps its original positional parameter order"""
+        with mock.patch.object(main_module, 'db2op', return_value=4) as db2op_mock:
+            rc = db2admin("-DISPLAY DATABASE(*)", None, 'DB2P', 'DSNTIAD', 'DSNC10.DBCG.RUNLIB.LOAD',
+                          'DB2V13.SDSNLOAD', 'systsprt.out', 'sysprint.out', True)
+
+        self.assertEqual(rc, 4)
+        db2op_mock.assert_called_once_with(
+            sysin_content="-DISPLAY DATABASE(*)",
+            sysin_file=None,
+            system='DB2P',
+            plan='DSNTIAD',
+            toollib='DSNC10.DBCG.RUNLIB.LOAD',
+            steplib='DB2V13.SDSNLOAD',
+            systsprt_file='systsprt.out',
+            sysprint_file='sysprint.out',
+            verbose=True
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+# Made with Bob
\ No newline at end of file
@@ -3,101 +3,130 @@
 Test Db2 RUN PROGRAM execution using db2run
 """
 
+import importlib
+import logging
 import os
-import sys
 import unittest
+from types import MappingProxyType
+from unittest import mock
 from batchtsocmd.main import db2run
 
+# The module itself: the package attribute 'main' is the main() function
+main_module = importlib.import_module('batchtsocmd.main')
+
+log = logging.getLogger(__name__)
+
+# Keywords shared by the runs that pass validation
+_RUN_BASE = MappingProxyType({
+    'program': 'BANKDATA',
+    'system': 'NOOK',
+    'plan': 'CBSA',
+    'toollib': 'CBSA.CICSBSA.LOADLIB',
+})
+
 
 class TestDb2RunValidation(unittest.TestCase):
     """Test db2run parameter validation (no z/OS connection required)"""
 
-    def test_01_db2run_missing_program(self):
-        """Test db2run validation - program parameter is required"""
-        rc = db2run(
-            system='DB2P',
-            plan='CBSA',
-            toollib='CBSA.CICSBSA.LOADLIB',
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when program parameter is missing")
+    fn = staticmethod(db2run)
 
-    def test_02_db2run_missing_system(self):
-        """Test db2run validation - system parameter is required"""
-        rc = db2run(
-            program='BANKDATA',
-            plan='CBSA',
-            toollib='CBSA.CICSBSA.LOADLIB',
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when system parameter is missing")
+    @classmethod
+    def setUpClass(cls):
+        # Only validation is tested here, so the SYSTSIN work file and
+        # tsocmd() are replaced once for the whole class: calls that pass
+        # validation return 99 at once, with no file written and no IKJEFT1B
+        patcher = mock.patch.object(main_module, '_systsin_work_file', return_value='SYSTSIN')
+        cls.systsin_work_file = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+        patcher = mock.patch.object(main_module, 'tsocmd', return_value=99)
+        cls.tsocmd = patcher.start()
+        cls.addClassCleanup(patcher.stop)
 
-    def test_03_db2run_missing_plan(self):
-        """Test db2run validation - plan parameter is required"""
-        rc = db2run(
-            program='BANKDATA',
-            system='DB2P',
-            toollib='CBSA.CICSBSA.LOADLIB',
+    def setUp(self):
+        self.systsin_work_file.reset_mock()
+        self.tsocmd.reset_mock()
+
+    def assertValidationPassed(self, rc, message):
+        """Assert that a call passed validation and reached tsocmd() once"""
+        self.assertEqual(rc, 99, message)
+        self.tsocmd.assert_called_once()
+
+    def assertValidationRejected(self, rc, message):
+        """Assert that a call was rejected with rc 8 before any work was done"""
+        self.assertEqual(rc, 8, message)
+        self.systsin_work_file.assert_not_called()
+        self.tsocmd.assert_not_called()
+
+    # (name, db2run() keywords, whether validation rejects them with rc 8,
+    # assertion message). Cases that pass validation get the patched
+    # tsocmd()'s return code.
+    VALIDATION_CASES = (
+        ('missing_program',
+         dict(system='DB2P', plan='CBSA', toollib='CBSA.CICSBSA.LOADLIB'),
+         True, "Expected error code 8 when program parameter is missing"),
+        ('missing_system',
+         dict(program='BANKDATA', plan='CBSA', toollib='CBSA.CICSBSA.LOADLIB'),
+         True, "Expected error code 8 when system parameter is missing"),
+        ('missing_plan',
+         dict(program='BANKDATA', system='DB2P', toollib='CBSA.CICSBSA.LOADLIB'),
+         True, "Expected error code 8 when plan parameter is missing"),
+        ('missing_toollib',
+         dict(program='BANKDATA', system='DB2P', plan='CBSA'),
+         True, "Expected error code 8 when toollib parameter is missing"),
+        ('invalid_subsystem',
+         {**_RUN_BASE, 'steplib': 'DB2V13.SDSNLOAD'},
+         False, "Validation should pass; failure should be at execution"),
+        ('with_parm',
+         {**_RUN_BASE, 'parms': '1,10000,1,1000000000000000',
+          'steplib': 'CBSA.CICSBSA.DBRM:CBSA.CICSBSA.LOADLIB:DB2V13.SDSNLOAD'},
+         False, "Validation should pass with parm string"),
+    )
+
+    def test_01_db2run_validation(self):
+        """Test db2run validation of required parameters"""
+        for name, kwargs, rejected, message in self.VALIDATION_CASES:
+            with self.subTest(name):
+                self.setUp()
+                rc = self.fn(**kwargs)
+                if rejected:
+                    self.assertValidationRejected(rc, message)
+                else:
+                    self.assertValidationPassed(rc, message)
+
+    def test_07_db2run_systsin(self):
+        """Test the SYSTSIN that db2run generates (and prints in verbose mode)"""
+        from batchtsocmd.main import _run_program_systsin
+
+        systsin = _run_program_systsin('NOOK', 'BANKDATA', 'CBSA', 'CBSA.CICSBSA.LOADLIB', '1,100,1,12345')
+
+        self.assertEqual(
+            systsin,
+            "  DSN SYSTEM(NOOK)\n"
+            "  RUN PROGRAM(BANKDATA) PLAN(CBSA) -\n"
+            "       LIB('CBSA.CICSBSA.LOADLIB') PARM('1,100,1,12345')\n"
+            "  END\n"
         )
-        self.assertEqual(rc, 8, "Expected error code 8 when plan parameter is missing")
+        self.assertNotIn('PARM(', _run_program_systsin('NOOK', 'BANKDATA', 'CBSA', 'CBSA.CICSBSA.LOADLIB'),
+                         "SYSTSIN should have no PARM without parms")
 
-    def test_04_db2run_missing_toollib(self):
-        """Test db2run validation - toollib parameter is required"""
-        rc = db2run(
-            program='BANKDATA',
-            system='DB2P',
-            plan='CBSA',
-        )
-        self.assertEqual(rc, 8, "Expected error code 8 when toollib parameter is missing")
 
-    def test_05_db2run_invalid_subsystem(self):
-        """Test db2run with invalid subsystem - fails at execution, not validation"""
-        rc = db2run(
-            program='BANKDATA',
-            system='NOOK',
-            plan='CBSA',
-            toollib='CBSA.CICSBSA.LOADLIB',
-            steplib='DB2V13.SDSNLOAD',
-        )
-        # Should fail at execution (NOOK not valid), not at validation (rc != 8)
-        self.assertNotEqual(rc, 8, "Validation should pass; failure should be at execution")
+def _build_live_steplib():
+    """
+    Build the live BANKDATA STEPLIB from the environment: DB2_DBRMLIB,
+    DB2_TOOLLIB, then each DB2_STEPLIB dataset, or None if none are set
+    """
+    environ = os.environ
+    steplib_parts = [dsn for dsn in (environ.get('DB2_DBRMLIB'), environ.get('DB2_TOOLLIB')) if dsn]
+    steplib = environ.get('DB2_STEPLIB')
+    if steplib:
+        steplib_parts.extend(steplib.split(':'))
+    return tuple(steplib_parts) or None
 
-    def test_06_db2run_with_parm(self):
-        """Test db2run with PARM string - fails at execution with invalid subsystem"""
-        rc = db2run(
-            program='BANKDATA',
-            system='NOOK',
-            plan='CBSA',
-            toollib='CBSA.CICSBSA.LOADLIB',
-            parms='1,10000,1,1000000000000000',
-            steplib='CBSA.CICSBSA.DBRM:CBSA.CICSBSA.LOADLIB:DB2V13.SDSNLOAD',
-        )
-        # Should fail at execution (NOOK not valid), not at validation
-        self.assertNotEqual(rc, 8, "Validation should pass with parm string")
-
-    def test_07_db2run_verbose_output(self):
-        """Test db2run verbose mode prints SYSTSIN content to stdout"""
-        import io
-        from contextlib import redirect_stdout
-
-        stdout_capture = io.StringIO()
-        with redirect_stdout(stdout_capture):
-            rc = db2run(
-                program='BANKDATA',
-                system='NOOK',
-                plan='CBSA',
-                toollib='CBSA.CICSBSA.LOADLIB',
-                parms='1,100,1,12345',
-                steplib='DB2V13.SDSNLOAD',
-                verbose=True,
-            )
-
-        verbose_output = stdout_capture.getvalue()
-        print(f"\n=== db2run verbose output ===\n{verbose_output}", file=sys.stderr)
-
-        # Verbose output (stdout) should contain the generated SYSTSIN content
-        self.assertIn('BANKDATA', verbose_output, "Verbose output should contain program name")
-        self.assertIn('CBSA', verbose_output, "Verbose output should contain plan name")
+
+_LIVE_STEPLIB = _build_live_steplib()
 
 
+@unittest.skipUnless(os.environ.get('DB2_SYSTEM'), "DB2_SYSTEM environment variable not set - skipping live execution tests")
 class TestDb2RunExecution(unittest.TestCase):
     """Test db2run execution against a live Db2 subsystem.
 
@@ -105,11 +134,16 @@ class TestDb2RunExecution(unittest.TestCase):
     if DB2_SYSTEM is not set in the environment.
     """
 
-    def setUp(self):
-        self.system = os.environ.get('DB2_SYSTEM')
-        self.steplib = os.environ.get('DB2_STEPLIB')
-        if not self.system:
-            self.skipTest("DB2_SYSTEM environment variable not set - skipping live execution tests")
+    fn = staticmethod(db2run)
+
+    @classmethod
+    def setUpClass(cls):
+        # The environment is read once for the whole class
+        environ = os.environ
+        cls.system = environ['DB2_SYSTEM']
+        cls.plan = environ.get('DB2_PLAN', 'CBSA')
+        cls.toollib = environ.get('DB2_TOOLLIB')
+        cls.live_steplib = _LIVE_STEPLIB
 
     def test_08_db2run_live_bankdata(self):
         """Test db2run executing BANKDATA program against a live Db2 subsystem.
@@ -120,33 +154,22 @@ class TestDb2RunExecution(unittest.TestCase):
           PARM('1,10000,1,1000000000000000')
           LIB('@BANK_LOADLIB@')
         """
-        plan = os.environ.get('DB2_PLAN', 'CBSA')
-        toollib = os.environ.get('DB2_TOOLLIB')
-        dbrmlib = os.environ.get('DB2_DBRMLIB')
+        toollib = self.toollib
 
         if not toollib:
             self.skipTest("DB2_TOOLLIB environment variable not set")
 
-        steplib_parts = []
-        if dbrmlib:
-            steplib_parts.append(dbrmlib)
-        if toollib:
-            steplib_parts.append(toollib)
-        if self.steplib:
-            steplib_parts.extend(self.steplib.split(':'))
-        steplib_list = steplib_parts if steplib_parts else None
-
-        rc = db2run(
+        rc = self.fn(
             program='BANKDATA',
             system=self.system,
-            plan=plan,
+            plan=self.plan,
             toollib=toollib,
             parms='1,100,1,1000000000000000',
-            steplib=steplib_list,
+            steplib=self.live_steplib,
             verbose=True,
         )
 
-        print(f"\n=== db2run live BANKDATA RC={rc} ===", file=sys.stderr)
+        log.debug("=== db2run live BANKDATA RC=%s ===", rc)
         self.assertEqual(rc, 0, f"Expected RC=0 for BANKDATA execution, got RC={rc}")
 
 